@@ -5,13 +5,17 @@ Run with: streamlit run dashboard.py
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
+import heapq
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import sys
+import threading
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
@@ -21,6 +25,48 @@ from cli.utils.broker import get_broker
 from cli.utils.market_data import MarketDataProvider
 from cli.utils.sentiment_aggregator import get_sentiment_aggregator
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Auto-refresh cadence (seconds) per dashboard panel; each panel is a
+# fragment, so only that panel reruns when its timer fires
+PANEL_REFRESH_SECONDS = {
+    'render_company_overview': 5,
+    'render_agent_status': 30,
+    'render_positions': 5,
+    'render_pnl_chart': 30,
+    'render_sentiment_tracking': 300,
+    'render_risk_monitoring': 30,
+    'render_recent_activity': 10,
+}
+
+# Broker position fields shown in the positions table -> column headers
+POSITION_FIELDS = {
+    'symbol': 'Symbol',
+    'side': 'Side',
+    'qty': 'Quantity',
+    'avg_entry_price': 'Entry Price',
+    'current_price': 'Current Price',
+    'market_value': 'Market Value',
+    'unrealized_pl': 'P&L',
+    'unrealized_plpc': 'P&L %',
+}
+
+# Client-side number formats for numeric table columns
+POSITION_COLUMNS = {
+    'Entry Price': st.column_config.NumberColumn(format='$%.2f'),
+    'Current Price': st.column_config.NumberColumn(format='$%.2f'),
+    'Market Value': st.column_config.NumberColumn(format='$%.2f'),
+    'P&L': st.column_config.NumberColumn(format='$%+.2f'),
+    'P&L %': st.column_config.NumberColumn(format='%+.2f%%'),
+}
+SENTIMENT_COLUMNS = {
+    'Confidence': st.column_config.NumberColumn(format='%.0f%%'),
+    'Agreement': st.column_config.NumberColumn(format='%.0f%%'),
+}
+
 # Page configuration
 st.set_page_config(
     page_title="Ztrade Dashboard",
@@ -59,50 +105,92 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+@st.cache_data(ttl=60)
+def _load_configs():
+    """Load company and agent configurations (change rarely, 60-second cache)."""
+    config = get_config()
+    company_config = config.load_company_config()
+    agent_configs = {
+        agent_id: config.load_agent_config(agent_id)
+        for agent_id in config.list_agents()
+    }
+    return company_config, agent_configs
+
+
+@st.cache_data(ttl=5)
+def _load_broker_snapshot():
+    """Load account and positions from the broker (volatile, 5-second cache)."""
+    broker = get_broker()
+    return broker.get_account_info(), broker.get_positions()
+
+
 @st.cache_data(ttl=30)
-def load_dashboard_data():
-    """Load all dashboard data with 30-second cache."""
+def _load_agent_states(agent_ids):
+    """Load agent state files (30-second cache)."""
     config = get_config()
+    return {agent_id: config.load_agent_state(agent_id) for agent_id in agent_ids}
 
-    try:
-        # Load configurations
-        company_config = config.load_company_config()
-        agents = config.list_agents()
-
-        # Get broker data
-        broker = get_broker()
-        account = broker.get_account_info()
-        positions = broker.get_positions()
-
-        # Get agent data
-        agent_data = []
-        for agent_id in agents:
-            agent_config = config.load_agent_config(agent_id)
-            agent_state = config.load_agent_state(agent_id)
-            agent_data.append({
-                'id': agent_id,
-                'name': agent_config.get('agent', {}).get('name', agent_id),
-                'asset': agent_config.get('agent', {}).get('asset', 'N/A'),
-                'status': agent_config.get('agent', {}).get('status', 'unknown'),
-                'strategy': agent_config.get('strategy', {}).get('type', 'N/A'),
-                'allocated_capital': agent_config.get('performance', {}).get('allocated_capital', 0),
-                'pnl_today': agent_state.get('pnl_today', 0),
-                'trades_today': agent_state.get('trades_today', 0),
-                'positions': agent_state.get('positions', []),
-            })
 
-        return {
-            'company_config': company_config,
-            'account': account,
-            'positions': positions,
-            'agents': agent_data,
-            'timestamp': datetime.now()
-        }
+def load_dashboard_data():
+    """Load all dashboard data, or report the error and return None."""
+    try:
+        return _build_dashboard_data()
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return None
 
 
+@st.cache_data(ttl=5, show_spinner=False)
+def _build_dashboard_data():
+    """
+    Assemble dashboard data from the per-source caches (5-second cache).
+
+    Every panel fragment loads this on each run; caching the assembled dict
+    means a full page run builds it once instead of once per panel. The TTL
+    matches the shortest source cache (broker snapshot).
+    """
+    company_config, agent_configs = _load_configs()
+    account, positions = _load_broker_snapshot()
+    agent_states = _load_agent_states(tuple(agent_configs))
+
+    # Get agent data
+    agent_data = []
+    for agent_id, agent_config in agent_configs.items():
+        agent_state = agent_states.get(agent_id, {})
+        agent_data.append({
+            'id': agent_id,
+            'name': agent_config.get('agent', {}).get('name', agent_id),
+            'asset': agent_config.get('agent', {}).get('asset', 'N/A'),
+            'status': agent_config.get('agent', {}).get('status', 'unknown'),
+            'strategy': agent_config.get('strategy', {}).get('type', 'N/A'),
+            'allocated_capital': agent_config.get('performance', {}).get('allocated_capital', 0),
+            'pnl_today': agent_state.get('pnl_today', 0),
+            'trades_today': agent_state.get('trades_today', 0),
+            'positions': agent_state.get('positions', []),
+        })
+
+    # Shared by the agent status, P&L chart and risk panels
+    agents_df = pd.DataFrame(agent_data)
+    if agents_df.empty:
+        totals = {'capital': 0, 'pnl': 0, 'trades': 0}
+    else:
+        totals = {
+            'capital': agents_df['allocated_capital'].sum(),
+            'pnl': agents_df['pnl_today'].sum(),
+            'trades': agents_df['trades_today'].sum(),
+        }
+
+    return {
+        'company_config': company_config,
+        'account': account,
+        'positions': positions,
+        'agents': agent_data,
+        'agents_df': agents_df,
+        'totals': totals,
+        'timestamp': datetime.now()
+    }
+
+
 def render_company_overview(data):
     """Render company overview section."""
     st.markdown('<h2>📊 Company Overview</h2>', unsafe_allow_html=True)
@@ -148,13 +236,13 @@ def render_agent_status(data):
     """Render agent status section."""
     st.markdown('<h2>🤖 Agent Status</h2>', unsafe_allow_html=True)
 
-    agents_df = pd.DataFrame(data['agents'])
+    agents_df = data['agents_df']
 
     if not agents_df.empty:
-        # Calculate totals
-        total_capital = agents_df['allocated_capital'].sum()
-        total_pnl = agents_df['pnl_today'].sum()
-        total_trades = agents_df['trades_today'].sum()
+        totals = data['totals']
+        total_capital = totals['capital']
+        total_pnl = totals['pnl']
+        total_trades = totals['trades']
 
         # Summary metrics
         col1, col2, col3 = st.columns(3)
@@ -208,26 +296,15 @@ def render_positions(data):
         st.info("No open positions.")
         return
 
-    # Create positions dataframe
-    positions_data = []
-    for pos in positions:
-        positions_data.append({
-            'Symbol': pos['symbol'],
-            'Side': pos['side'].upper(),
-            'Quantity': pos['qty'],
-            'Entry Price': f"${pos['avg_entry_price']:.2f}",
-            'Current Price': f"${pos['current_price']:.2f}",
-            'Market Value': f"${pos['market_value']:,.2f}",
-            'P&L': f"${pos['unrealized_pl']:+,.2f}",
-            'P&L %': f"{pos['unrealized_plpc']*100:+.2f}%"
-        })
-
-    positions_df = pd.DataFrame(positions_data)
-    st.dataframe(positions_df, width="stretch")
+    # Create positions dataframe; numbers stay numeric and are formatted client-side
+    positions_df = pd.json_normalize(positions)[list(POSITION_FIELDS)].rename(columns=POSITION_FIELDS)
+    positions_df['Side'] = positions_df['Side'].str.upper().astype('category')
+    positions_df['P&L %'] *= 100
+    st.dataframe(positions_df, width="stretch", column_config=POSITION_COLUMNS)
 
     # Total P&L
-    total_pl = sum(p['unrealized_pl'] for p in positions)
-    total_value = sum(p['market_value'] for p in positions)
+    total_pl = positions_df['P&L'].sum()
+    total_value = positions_df['Market Value'].sum()
 
     col1, col2 = st.columns(2)
     with col1:
@@ -241,7 +318,7 @@ def render_pnl_chart(data):
     """Render P&L chart."""
     st.markdown('<h2>📊 Agent P&L Comparison</h2>', unsafe_allow_html=True)
 
-    agents_df = pd.DataFrame(data['agents'])
+    agents_df = data['agents_df']
 
     if agents_df.empty:
         st.info("No agent data available.")
@@ -263,44 +340,88 @@ def render_pnl_chart(data):
         xaxis_title='Agent',
         yaxis_title='P&L ($)',
         showlegend=False,
-        height=400
+        height=400,
+        # Keep zoom/pan and hover state when the panel refreshes
+        uirevision='pnl'
     )
 
     st.plotly_chart(fig)
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_sentiments(assets):
+    """
+    Fetch aggregated sentiment for several assets concurrently (5-minute cache).
+
+    Args:
+        assets: Sorted tuple of asset symbols (the cache key)
+
+    Returns:
+        Tuple of ({asset: sentiment}, {asset: error message})
+    """
+    sentiments = {}
+    errors = {}
+
+    # PRAW's Reddit client isn't thread-safe, so each worker thread builds
+    # its own aggregator (and with it its own Reddit client)
+    workers = threading.local()
+
+    def fetch(asset):
+        aggregator = getattr(workers, 'aggregator', None)
+        if aggregator is None:
+            aggregator = workers.aggregator = get_sentiment_aggregator(use_cache=True)
+        return aggregator.get_aggregated_sentiment(
+            symbol=asset,
+            news_lookback_hours=24,
+            reddit_lookback_hours=24,
+            sec_lookback_days=30
+        )
+
+    # Each asset hits news, Reddit and SEC APIs; overlap the round-trips
+    with ThreadPoolExecutor(max_workers=min(8, len(assets))) as executor:
+        futures = {executor.submit(fetch, asset): asset for asset in assets}
+        for future in as_completed(futures):
+            asset = futures[future]
+            try:
+                sentiments[asset] = future.result()
+            except Exception as e:
+                errors[asset] = str(e)
+
+    return sentiments, errors
+
+
 def render_sentiment_tracking(data):
     """Render sentiment tracking section."""
     st.markdown('<h2>💭 Sentiment Tracking</h2>', unsafe_allow_html=True)
 
     try:
-        aggregator = get_sentiment_aggregator()
+        # Unique assets in agent order
+        assets = list(dict.fromkeys(
+            agent['asset'] for agent in data['agents']
+            if agent['asset'] and agent['asset'] != 'N/A'
+        ))
+        sentiments, errors = _fetch_sentiments(tuple(sorted(assets))) if assets else ({}, {})
 
         sentiment_data = []
-        for agent in data['agents']:
-            asset = agent['asset']
-            if asset and asset != 'N/A':
-                try:
-                    sentiment = aggregator.get_aggregated_sentiment(
-                        symbol=asset,
-                        news_lookback_hours=24,
-                        reddit_lookback_hours=24,
-                        sec_lookback_days=30
-                    )
-                    sentiment_data.append({
-                        'Asset': asset,
-                        'Sentiment': sentiment.get('overall_sentiment', 'N/A'),
-                        'Score': sentiment.get('sentiment_score', 0),
-                        'Confidence': f"{sentiment.get('confidence', 0)*100:.0f}%",
-                        'Sources': sentiment.get('sources_used', 0),
-                        'Agreement': f"{sentiment.get('agreement_level', 0)}%"
-                    })
-                except Exception as e:
-                    st.warning(f"Could not fetch sentiment for {asset}: {e}")
+        for asset in assets:
+            if asset in errors:
+                st.warning(f"Could not fetch sentiment for {asset}: {errors[asset]}")
+                continue
+
+            sentiment = sentiments[asset]
+            sentiment_data.append({
+                'Asset': asset,
+                'Sentiment': sentiment.get('overall_sentiment', 'N/A'),
+                'Score': sentiment.get('sentiment_score', 0),
+                'Confidence': sentiment.get('confidence', 0) * 100,
+                'Sources': sentiment.get('sources_used', 0),
+                'Agreement': sentiment.get('agreement_level', 0) * 100
+            })
 
         if sentiment_data:
             sentiment_df = pd.DataFrame(sentiment_data)
-            st.dataframe(sentiment_df, width="stretch")
+            sentiment_df['Sentiment'] = sentiment_df['Sentiment'].astype('category')
+            st.dataframe(sentiment_df, width="stretch", column_config=SENTIMENT_COLUMNS)
 
             # Sentiment gauge charts - create individual columns for each
             num_assets = len(sentiment_data)
@@ -339,7 +460,8 @@ def render_sentiment_tracking(data):
 
                     fig.update_layout(
                         height=250,
-                        margin=dict(l=20, r=20, t=50, b=20)
+                        margin=dict(l=20, r=20, t=50, b=20),
+                        uirevision=item['Asset']
                     )
                     st.plotly_chart(fig)
         else:
@@ -357,10 +479,10 @@ def render_risk_monitoring(data):
     max_capital = company_config.get('max_capital_allocation', 100000)
 
     # Calculate risk metrics
-    total_allocated = sum(a['allocated_capital'] for a in data['agents'])
+    total_allocated = data['totals']['capital']
     utilization = (total_allocated / max_capital * 100) if max_capital > 0 else 0
 
-    total_pnl_today = sum(a['pnl_today'] for a in data['agents'])
+    total_pnl_today = data['totals']['pnl']
     daily_loss_pct = (total_pnl_today / max_capital * 100) if max_capital > 0 else 0
 
     col1, col2, col3 = st.columns(3)
@@ -394,17 +516,21 @@ def render_risk_monitoring(data):
     # Risk rules status
     st.markdown("### Risk Rules Status")
 
-    risk_checks = []
+    risk_frames = []
 
-    # RULE_001: No agent exceeds 10% of capital
-    for agent in data['agents']:
-        pct = (agent['allocated_capital'] / max_capital * 100) if max_capital > 0 else 0
-        risk_checks.append({
+    # RULE_001: No agent exceeds 10% of capital (one vectorized pass over agents)
+    agents_df = data['agents_df']
+    if not agents_df.empty:
+        allocated = agents_df['allocated_capital'].to_numpy(dtype=float)
+        pct = allocated / max_capital * 100 if max_capital > 0 else np.zeros(len(allocated))
+        risk_frames.append(pd.DataFrame({
             'Rule': 'RULE_001',
-            'Description': f"{agent['name']}: Agent allocation",
-            'Status': '✅ PASS' if pct <= 10 else '❌ FAIL',
-            'Value': f"{pct:.1f}% (limit: 10%)"
-        })
+            'Description': agents_df['name'].astype(str) + ': Agent allocation',
+            'Status': np.where(pct <= 10, '✅ PASS', '❌ FAIL'),
+            'Value': [f"{p:.1f}% (limit: 10%)" for p in pct]
+        }))
+
+    risk_checks = []
 
     # RULE_002: Daily loss limit
     risk_checks.append({
@@ -422,10 +548,43 @@ def render_risk_monitoring(data):
         'Value': f"{utilization:.1f}% (limit: 80%)"
     })
 
-    risk_df = pd.DataFrame(risk_checks)
+    risk_frames.append(pd.DataFrame(risk_checks))
+    risk_df = pd.concat(risk_frames, ignore_index=True)
+    risk_df['Status'] = risk_df['Status'].astype('category')
     st.dataframe(risk_df, width="stretch")
 
 
+@st.cache_data(ttl=10)
+def _load_recent_decisions(today_dir, dir_mtime_ns, limit=5):
+    """
+    Read the most recent decision files from a day's log directory.
+
+    Args:
+        today_dir: Directory holding the day's decision JSON files
+        dir_mtime_ns: Directory mtime, part of the cache key so new files show up
+        limit: Number of most recent decisions to load
+
+    Returns:
+        Tuple of (file_count, [(file_name, decision, error), ...]) newest first
+    """
+    log_files = list(Path(today_dir).glob('*.json'))
+
+    # Only the newest few are shown, so avoid sorting the whole day's files
+    recent = []
+    for log_file in heapq.nlargest(limit, log_files, key=lambda x: x.stat().st_mtime):
+        try:
+            if orjson is not None:
+                decision = orjson.loads(log_file.read_bytes())
+            else:
+                with open(log_file, 'r') as f:
+                    decision = json.load(f)
+            recent.append((log_file.name, decision, None))
+        except Exception as e:
+            recent.append((log_file.name, None, str(e)))
+
+    return len(log_files), recent
+
+
 def render_recent_activity(data):
     """Render recent trading activity."""
     st.markdown('<h2>📝 Recent Activity</h2>', unsafe_allow_html=True)
@@ -442,17 +601,18 @@ def render_recent_activity(data):
     today_dir = logs_dir / today
 
     if today_dir.exists():
-        log_files = sorted(today_dir.glob('*.json'), key=lambda x: x.stat().st_mtime, reverse=True)
+        file_count, recent = _load_recent_decisions(str(today_dir), today_dir.stat().st_mtime_ns)
 
-        if log_files:
-            st.markdown(f"**Found {len(log_files)} decisions today**")
+        if file_count:
+            st.markdown(f"**Found {file_count} decisions today**")
 
             # Show last 5 decisions
-            for log_file in log_files[:5]:
-                try:
-                    with open(log_file, 'r') as f:
-                        decision = json.load(f)
+            for name, decision, error in recent:
+                if error:
+                    st.warning(f"Could not read {name}: {error}")
+                    continue
 
+                try:
                     timestamp = decision.get('timestamp', 'N/A')
                     agent_id = decision.get('agent_id', 'N/A')
                     action = decision.get('action', 'N/A')
@@ -460,7 +620,7 @@ def render_recent_activity(data):
 
                     st.text(f"{timestamp} | {agent_id} | {action.upper()} | Confidence: {confidence:.0%}")
                 except Exception as e:
-                    st.warning(f"Could not read {log_file.name}: {e}")
+                    st.warning(f"Could not read {name}: {e}")
         else:
             st.info("No decisions logged today yet.")
     else:
@@ -478,10 +638,10 @@ def main():
         st.markdown("## ⚙️ Settings")
 
         # Auto-refresh toggle
-        auto_refresh = st.checkbox("Auto-refresh (30s)", value=True)
+        auto_refresh = st.checkbox("Auto-refresh", value=True)
 
         if auto_refresh:
-            st.info("Dashboard refreshes every 30 seconds")
+            st.info("Panels refresh independently (positions every 5s, sentiment every 5min)")
 
         # Manual refresh button
         if st.button("🔄 Refresh Now"):
@@ -514,31 +674,32 @@ def main():
         return
 
     # Render sections
-    render_company_overview(data)
-    st.markdown("---")
-
-    render_agent_status(data)
-    st.markdown("---")
-
-    render_positions(data)
-    st.markdown("---")
-
-    render_pnl_chart(data)
-    st.markdown("---")
-
-    render_sentiment_tracking(data)
-    st.markdown("---")
-
-    render_risk_monitoring(data)
-    st.markdown("---")
-
-    render_recent_activity(data)
-
-    # Auto-refresh
-    if auto_refresh:
-        import time
-        time.sleep(30)
-        st.rerun()
+    panels = [
+        render_company_overview,
+        render_agent_status,
+        render_positions,
+        render_pnl_chart,
+        render_sentiment_tracking,
+        render_risk_monitoring,
+        render_recent_activity,
+    ]
+    for idx, render in enumerate(panels):
+        if idx:
+            st.markdown("---")
+        run_every = PANEL_REFRESH_SECONDS[render.__name__] if auto_refresh else None
+        _render_panel(render, run_every)
+
+
+def _render_panel(render, run_every):
+    """Render a dashboard section as a fragment that reruns on its own timer."""
+    def panel():
+        # Reload on every fragment run; load_dashboard_data is cached for 5s,
+        # so panels rerunning together share one build
+        data = load_dashboard_data()
+        if data is not None:
+            render(data)
+
+    st.fragment(panel, run_every=run_every)()
 
 
 if __name__ == "__main__":
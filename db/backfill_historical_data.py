@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 """Backfill historical market data from Alpaca, Alpha Vantage, or CoinGecko for backtesting."""
+import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-import time
+from functools import lru_cache
+import threading
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional
-import yaml
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -15,11 +19,74 @@ from cli.utils.alphavantage_provider import get_alphavantage_provider
 from cli.utils.coingecko_provider import get_coingecko_provider
 from cli.utils.sentiment_aggregator import get_sentiment_aggregator
 from cli.utils.logger import get_logger
+from ztrade.core.config import get_config
 # Use new SQLite database
 from ztrade.core.database import market_data_store, sentiment_data_store
+from ztrade.core.rate_limit import TokenBucket
 
 logger = get_logger(__name__)
 
+# Requests/minute allowed by each provider's (free) tier; fetches are paced by
+# a token bucket per provider rather than fixed sleeps
+RATE_LIMITS = MappingProxyType({
+    'alpaca': 200,
+    'alphavantage': 5,
+    'coingecko': 30,
+})
+BACKFILL_WORKERS = 8
+CHUNK_WORKERS = 4  # Concurrent date-range chunk requests, shared by all fetches in a run
+SENTIMENT_WORKERS = 4
+
+_limiters = {provider: TokenBucket(limit, per=60) for provider, limit in RATE_LIMITS.items()}
+
+# Alpaca clients wrap requests sessions, which aren't documented as safe to
+# share across threads; each fetch worker gets its own broker instead
+_worker_brokers = threading.local()
+
+
+def _thread_broker():
+    """Return this thread's broker, creating it on first use."""
+    broker = getattr(_worker_brokers, 'broker', None)
+    if broker is None:
+        broker = _worker_brokers.broker = get_broker()
+    return broker
+
+
+# Backfill timeframe -> Alpaca timeframe name
+ALPACA_TIMEFRAMES = MappingProxyType({
+    '1m': '1Min',
+    '5m': '5Min',
+    '15m': '15Min',
+    '1h': '1Hour',
+    '1d': '1Day',
+})
+
+# Estimated bars per trading day for each Alpaca timeframe
+BARS_PER_DAY = MappingProxyType({
+    '1Min': 390,   # Market hours: 6.5 hours = 390 minutes
+    '5Min': 78,    # 390 / 5
+    '15Min': 26,   # 390 / 15
+    '1Hour': 6,    # Approximately 6.5 hours
+    '1Day': 1,
+})
+
+# Bar length per backfill timeframe, used to resume after the newest stored bar
+TIMEFRAME_DURATIONS = MappingProxyType({
+    '1m': timedelta(minutes=1),
+    '5m': timedelta(minutes=5),
+    '15m': timedelta(minutes=15),
+    '1h': timedelta(hours=1),
+    '1d': timedelta(days=1),
+})
+
+# How far after start_date the oldest stored bar may be and still count as
+# covering it: start_date is "now - days", which can fall on a weekend,
+# holiday or outside market hours, so the first real bar comes later
+RESUME_COVERAGE_SLACK = timedelta(days=4)
+
+# Symbols discovered on the last run, keyed by each context.yaml's mtime
+SYMBOLS_CACHE_FILE = '.agents_cache.json'
+
 
 def discover_symbols() -> List[str]:
     """Auto-discover symbols from agent configs."""
@@ -30,17 +97,68 @@ def discover_symbols() -> List[str]:
         logger.error("agents/ directory not found")
         return symbols
 
-    for agent_dir in agents_dir.iterdir():
-        if agent_dir.is_dir():
-            config_file = agent_dir / 'context.yaml'
-            if config_file.exists():
-                with open(config_file) as f:
-                    config = yaml.safe_load(f)
-                    asset = config.get('agent', {}).get('asset')
-                    if asset:
-                        symbols.append(asset)
+    mtimes = {}
+    with os.scandir(agents_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                config_file = os.path.join(entry.path, 'context.yaml')
+                try:
+                    mtimes[config_file] = os.stat(config_file).st_mtime_ns
+                except FileNotFoundError:
+                    continue
+
+    # Reuse the previous run's symbols unless an agent config was added,
+    # removed or edited since
+    cache_file = agents_dir / SYMBOLS_CACHE_FILE
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+        if cache.get('mtimes') == mtimes:
+            return cache['symbols']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    agent_config = get_config()
+    for config_file in mtimes:
+        # Parsed once per file version, shared with other config loads
+        config = agent_config.load_yaml(config_file)
+        asset = config.get('agent', {}).get('asset')
+        if asset:
+            symbols.append(asset)
+
+    symbols = list(set(symbols))
+    try:
+        with open(cache_file, 'w') as f:
+            json.dump({'mtimes': mtimes, 'symbols': symbols}, f)
+    except OSError as e:
+        logger.debug(f"Could not write symbols cache: {e}")
+
+    return symbols
 
-    return list(set(symbols))
+
+@lru_cache(maxsize=None)
+def _provider(factory):
+    """Create each market data provider once per run rather than per fetch."""
+    return factory()
+
+
+def _bars_from_frame(df) -> List[Dict[str, Any]]:
+    """Convert a provider OHLCV DataFrame to bar dicts, column by column."""
+    if df.empty:
+        return []
+
+    columns = (
+        [ts.isoformat() for ts in df['timestamp']],
+        df['open'].astype(float).tolist(),
+        df['high'].astype(float).tolist(),
+        df['low'].astype(float).tolist(),
+        df['close'].astype(float).tolist(),
+        df['volume'].astype('int64').tolist(),
+    )
+    return [
+        {'timestamp': t, 'open': o, 'high': h, 'low': lo, 'close': c, 'volume': v}
+        for t, o, h, lo, c, v in zip(*columns, strict=True)
+    ]
 
 
 def fetch_bars_alphavantage(
@@ -59,25 +177,16 @@ def fetch_bars_alphavantage(
     Returns:
         List of bar dictionaries
     """
-    av_provider = get_alphavantage_provider()
+    av_provider = _provider(get_alphavantage_provider)
 
     logger.info(f"Fetching {symbol} {timeframe} data from Alpha Vantage ({days_back} days)")
 
     try:
         # Alpha Vantage returns pandas DataFrame
+        _limiters['alphavantage'].acquire()
         df = av_provider.get_bars_for_timeframe(symbol, timeframe, days=days_back)
 
-        # Convert to list of dicts
-        bars = []
-        for _, row in df.iterrows():
-            bars.append({
-                'timestamp': row['timestamp'].isoformat(),
-                'open': float(row['open']),
-                'high': float(row['high']),
-                'low': float(row['low']),
-                'close': float(row['close']),
-                'volume': int(row['volume'])
-            })
+        bars = _bars_from_frame(df)
 
         logger.info(f"  Fetched {len(bars)} bars from Alpha Vantage")
         return bars
@@ -107,25 +216,16 @@ def fetch_bars_coingecko(
         CoinGecko free tier provides hourly price points (not true OHLC candles).
         O/H/L are approximated from Close prices.
     """
-    cg_provider = get_coingecko_provider()
+    cg_provider = _provider(get_coingecko_provider)
 
     logger.info(f"Fetching {symbol} {timeframe} data from CoinGecko ({days_back} days)")
 
     try:
         # CoinGecko returns pandas DataFrame
+        _limiters['coingecko'].acquire()
         df = cg_provider.get_bars_for_timeframe(symbol, timeframe, days=days_back)
 
-        # Convert to list of dicts
-        bars = []
-        for _, row in df.iterrows():
-            bars.append({
-                'timestamp': row['timestamp'].isoformat(),
-                'open': float(row['open']),
-                'high': float(row['high']),
-                'low': float(row['low']),
-                'close': float(row['close']),
-                'volume': int(row['volume'])
-            })
+        bars = _bars_from_frame(df)
 
         logger.info(f"  Fetched {len(bars)} bars from CoinGecko")
         return bars
@@ -135,24 +235,40 @@ def fetch_bars_coingecko(
         return []
 
 
+def _chunk_ranges(start_date: datetime, end_date: datetime, chunk_days: int):
+    """Yield (start, end) ISO strings covering the period in chunk_days windows."""
+    chunk = timedelta(days=chunk_days)
+    gap = timedelta(days=1)
+    current_start = start_date
+
+    while current_start < end_date:
+        current_end = min(current_start + chunk, end_date)
+        yield current_start.isoformat(), current_end.isoformat()
+        current_start = current_end + gap
+
+
 def fetch_bars_for_period(
     broker,
     symbol: str,
     timeframe: str,
     start_date: datetime,
     end_date: datetime,
-    provider: str = 'alpaca'
+    provider: str = 'alpaca',
+    chunk_executor: Optional[ThreadPoolExecutor] = None
 ) -> List[Dict[str, Any]]:
     """
     Fetch bars for a date range using pagination.
 
     Args:
-        broker: Broker instance (used if provider='alpaca')
+        broker: Broker instance (used if provider='alpaca'); if None, each
+            thread uses its own from _thread_broker()
         symbol: Symbol to fetch
         timeframe: Timeframe
         start_date: Start date
         end_date: End date
         provider: Data provider ('alpaca', 'alphavantage', or 'coingecko')
+        chunk_executor: Pool that fetches paginated Alpaca chunks concurrently;
+            chunks are fetched one after another if None
 
     Returns:
         List of bar dictionaries
@@ -171,40 +287,44 @@ def fetch_bars_for_period(
     # Alpaca provider (original logic)
     all_bars = []
 
+    # Only fetch bars newer than what's already stored, and only when the
+    # stored bars reach back to start_date; otherwise the older part of the
+    # range was never fetched and the whole range is requested
+    earliest, latest = market_data_store.get_timestamp_range(symbol, timeframe)
+    if earliest is not None:
+        earliest, latest = (
+            ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts
+            for ts in (earliest, latest)
+        )
+    if earliest is not None and earliest <= start_date + RESUME_COVERAGE_SLACK:
+        resume_from = latest + TIMEFRAME_DURATIONS.get(timeframe, timedelta(0))
+        if resume_from >= end_date:
+            logger.info(f"  {symbol} {timeframe} already up to date (latest bar {latest})")
+            return all_bars
+        if resume_from > start_date:
+            logger.info(f"  {symbol} {timeframe} resuming after stored bar at {latest}")
+            start_date = resume_from
+
     # Calculate approximate number of bars we'll need
     duration = (end_date - start_date).total_seconds()
 
-    # Estimate bars per period
-    bars_per_day = {
-        '1Min': 390,   # Market hours: 6.5 hours = 390 minutes
-        '5Min': 78,    # 390 / 5
-        '15Min': 26,   # 390 / 15
-        '1Hour': 6,    # Approximately 6.5 hours
-        '1Day': 1,
-    }
-
     # Use broker's get_bars which has 10,000 limit
     # For longer periods, we'll need to chunk
-    timeframe_alpaca = {
-        '1m': '1Min',
-        '5m': '5Min',
-        '15m': '15Min',
-        '1h': '1Hour',
-        '1d': '1Day',
-    }.get(timeframe, timeframe)
+    timeframe_alpaca = ALPACA_TIMEFRAMES.get(timeframe, timeframe)
 
     # Calculate total days
     days = (end_date - start_date).days
 
     # Estimate total bars
-    estimated_bars = days * bars_per_day.get(timeframe_alpaca, 100)
+    estimated_bars = days * BARS_PER_DAY.get(timeframe_alpaca, 100)
 
     logger.info(f"Fetching {symbol} {timeframe} data from {start_date.date()} to {end_date.date()}")
     logger.info(f"Estimated bars: ~{estimated_bars}")
 
     if estimated_bars <= 10000:
         # Single request with date range
-        bars = broker.get_bars(
+        _limiters['alpaca'].acquire()
+        bars = (broker if broker is not None else _thread_broker()).get_bars(
             symbol,
             timeframe_alpaca,
             limit=10000,
@@ -220,29 +340,29 @@ def fetch_bars_for_period(
         if timeframe_alpaca in ['1Hour', '1Day']:
             chunk_days = 365  # 1 year at a time for hourly/daily
 
-        current_start = start_date
-
-        while current_start < end_date:
-            current_end = min(current_start + timedelta(days=chunk_days), end_date)
+        chunk_ranges = list(_chunk_ranges(start_date, end_date, chunk_days))
+        logger.info(f"  Paginating in {len(chunk_ranges)} chunks of up to {chunk_days} days")
 
-            logger.info(f"  Fetching chunk: {current_start.date()} to {current_end.date()}")
+        def fetch_chunk(chunk_range):
+            chunk_start, chunk_end = chunk_range
+            logger.info(f"  Fetching chunk: {chunk_start[:10]} to {chunk_end[:10]}")
 
-            bars = broker.get_bars(
+            _limiters['alpaca'].acquire()
+            return (broker if broker is not None else _thread_broker()).get_bars(
                 symbol,
                 timeframe_alpaca,
                 limit=10000,
-                start=current_start.isoformat(),
-                end=current_end.isoformat()
+                start=chunk_start,
+                end=chunk_end
             )
 
+        # Chunks are independent, so overlap their requests; map() keeps them
+        # in date order and the shared limiter keeps the total under the cap
+        chunk_map = chunk_executor.map if chunk_executor is not None else map
+        for bars in chunk_map(fetch_chunk, chunk_ranges):
             # Add all bars from this chunk
             all_bars.extend(bars)
 
-            current_start = current_end + timedelta(days=1)
-
-            # Rate limiting
-            time.sleep(0.5)
-
     logger.info(f"  Fetched {len(all_bars)} bars for {symbol}")
     return all_bars
 
@@ -262,7 +382,7 @@ def fetch_sentiment_for_period(
     sentiments = []
 
     # Get current sentiment as a sample
-    aggregator = get_sentiment_aggregator()
+    aggregator = get_sentiment_aggregator(use_cache=True)
 
     try:
         sentiment_data = aggregator.get_aggregated_sentiment(
@@ -299,6 +419,54 @@ def fetch_sentiment_for_period(
     return sentiments
 
 
+# datetime.fromisoformat accepts a trailing 'Z' from Python 3.11; before that
+# Alpaca's UTC suffix has to be rewritten first
+if sys.version_info >= (3, 11):
+    _parse_timestamp = datetime.fromisoformat
+else:
+    def _parse_timestamp(timestamp: str) -> datetime:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+def fetch_db_bars(
+    broker,
+    symbol: str,
+    timeframe: str,
+    start_date: datetime,
+    end_date: datetime,
+    provider: str = 'alpaca',
+    chunk_executor: Optional[ThreadPoolExecutor] = None
+) -> List[tuple]:
+    """
+    Fetch bars for one symbol/timeframe and shape them for market_data_store.
+
+    Returns:
+        List of row tuples ready for insert_bar_rows
+    """
+    bars = fetch_bars_for_period(
+        broker, symbol, timeframe, start_date, end_date,
+        provider=provider, chunk_executor=chunk_executor
+    )
+
+    # Rows go straight to executemany in market_bars column order
+    # (vwap/trade_count are None: Alpaca's get_bars doesn't include them)
+    return [
+        (
+            symbol,
+            _parse_timestamp(bar['timestamp']),
+            timeframe,
+            bar['open'],
+            bar['high'],
+            bar['low'],
+            bar['close'],
+            bar['volume'],
+            None,
+            None
+        )
+        for bar in bars
+    ]
+
+
 def backfill_data(
     symbols: List[str] = None,
     days_back: int = 30,
@@ -316,10 +484,6 @@ def backfill_data(
         fetch_sentiment: Whether to fetch sentiment data
         provider: Data provider ('alpaca' or 'alphavantage')
     """
-    broker = None
-    if provider == 'alpaca':
-        broker = get_broker()
-
     # Auto-discover symbols if not provided
     if symbols is None:
         symbols = discover_symbols()
@@ -349,65 +513,77 @@ def backfill_data(
     total_bars = 0
     total_sentiment = 0
 
-    for symbol in symbols:
-        logger.info(f"\n📊 Processing {symbol}...")
-
-        # Fetch bars for each timeframe
-        for timeframe in timeframes:
+    # Sentiment comes from separate APIs, so fetch it in the background while
+    # bars download instead of after them
+    sentiment_executor = ThreadPoolExecutor(max_workers=SENTIMENT_WORKERS)
+    sentiment_futures = {}
+    if fetch_sentiment:
+        sentiment_futures = {
+            sentiment_executor.submit(
+                fetch_sentiment_for_period, symbol, start_date, end_date
+            ): symbol
+            for symbol in symbols
+        }
+
+    # Fetch every (symbol, timeframe) pair concurrently. Each provider's rate
+    # limiter paces its requests; Alpha Vantage and CoinGecko quotas are tight
+    # enough that they keep fetching one pair at a time. Inserts stay on this thread.
+    # Paginated fetches share one chunk pool for the whole run, so its threads
+    # (and the brokers they create) are reused instead of rebuilt per fetch
+    max_workers = BACKFILL_WORKERS if provider == 'alpaca' else 1
+    with ThreadPoolExecutor(max_workers=CHUNK_WORKERS) as chunk_executor, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                # No shared broker: each Alpaca fetch thread makes its own
+                fetch_db_bars, None, symbol, timeframe, start_date, end_date, provider,
+                chunk_executor
+            ): (symbol, timeframe)
+            for symbol in symbols
+            for timeframe in timeframes
+        }
+
+        # Bars are collected per symbol and inserted in one transaction once
+        # all of that symbol's timeframes have been fetched
+        symbol_bars: Dict[str, List[tuple]] = {symbol: [] for symbol in symbols}
+        remaining = {symbol: len(timeframes) for symbol in symbols}
+
+        for future in as_completed(futures):
+            symbol, timeframe = futures[future]
             try:
-                bars = fetch_bars_for_period(
-                    broker, symbol, timeframe, start_date, end_date, provider=provider
-                )
+                db_bars = future.result()
 
-                if not bars:
+                if db_bars:
+                    symbol_bars[symbol].extend(db_bars)
+                    logger.info(f"  Fetched {len(db_bars)} bars for {symbol} {timeframe}")
+                else:
                     logger.warning(f"  No bars fetched for {symbol} {timeframe}")
-                    continue
 
-                # Prepare for bulk insert
-                db_bars = []
-                for bar in bars:
-                    # Parse timestamp
-                    timestamp = datetime.fromisoformat(
-                        bar['timestamp'].replace('Z', '+00:00')
-                    )
-
-                    db_bars.append({
-                        'symbol': symbol,
-                        'timestamp': timestamp,
-                        'timeframe': timeframe,
-                        'open': bar['open'],
-                        'high': bar['high'],
-                        'low': bar['low'],
-                        'close': bar['close'],
-                        'volume': bar['volume'],
-                        'vwap': None,  # Alpaca's get_bars doesn't include VWAP
-                        'trade_count': None
-                    })
+            except Exception as e:
+                logger.error(f"  ❌ Error fetching {symbol} {timeframe}: {e}")
 
+            remaining[symbol] -= 1
+            if remaining[symbol] == 0 and symbol_bars[symbol]:
                 # Bulk insert
-                count = market_data_store.insert_bars_bulk(db_bars)
+                count = market_data_store.insert_bar_rows(symbol_bars.pop(symbol))
                 total_bars += count
-                logger.info(f"  ✅ Inserted {count} bars for {timeframe}")
-
-            except Exception as e:
-                logger.error(f"  ❌ Error fetching {symbol} {timeframe}: {e}")
+                logger.info(f"  ✅ Inserted {count} bars for {symbol}")
 
-        # Fetch sentiment
-        if fetch_sentiment:
+    # Store sentiment for every symbol in one transaction
+    all_sentiments = []
+    with sentiment_executor:
+        for future in as_completed(sentiment_futures):
+            symbol = sentiment_futures[future]
             try:
-                sentiments = fetch_sentiment_for_period(
-                    symbol, start_date, end_date
-                )
-
-                if sentiments:
-                    count = sentiment_data_store.insert_sentiments_bulk(sentiments)
-                    total_sentiment += count
-                    logger.info(f"  ✅ Inserted {count} sentiment records")
+                sentiments = future.result()
+
+                all_sentiments.extend(sentiments)
             except Exception as e:
                 logger.error(f"  ❌ Error fetching sentiment for {symbol}: {e}")
 
-        # Rate limiting between symbols
-        time.sleep(1)
+    if all_sentiments:
+        total_sentiment = sentiment_data_store.insert_sentiments_bulk(all_sentiments)
+        logger.info(f"  ✅ Inserted {total_sentiment} sentiment records")
 
     logger.info(f"\n" + "="*60)
     logger.info(f"✅ BACKFILL COMPLETE")
@@ -33,16 +33,18 @@ def create_migrations_table(conn):
 
 def get_applied_migrations(conn):
     """Get list of already applied migrations."""
-    cursor = conn.execute("SELECT migration_file FROM schema_migrations ORDER BY id")
-    return {row[0] for row in cursor.fetchall()}
+    # Only membership matters, so skip the ORDER BY sort
+    cursor = conn.execute("SELECT migration_file FROM schema_migrations")
+    return {migration_file for (migration_file,) in cursor}
 
 
 def get_pending_migrations(migrations_dir, applied):
     """Get list of pending migration files."""
-    all_migrations = sorted([
-        f for f in os.listdir(migrations_dir)
-        if f.endswith('.sql')
-    ])
+    with os.scandir(migrations_dir) as entries:
+        all_migrations = sorted(
+            entry.name for entry in entries
+            if entry.name.endswith('.sql') and entry.is_file()
+        )
     return [m for m in all_migrations if m not in applied]
 
 
@@ -57,8 +59,10 @@ def apply_migration(conn, migrations_dir, migration_file):
         sql = f.read()
 
     try:
-        # Execute migration (may contain multiple statements)
-        conn.executescript(sql)
+        # Execute migration (may contain multiple statements). executescript
+        # runs in autocommit mode, so open the transaction explicitly: the
+        # whole file plus its schema_migrations row commit (or roll back) once
+        conn.executescript(f"BEGIN;\n{sql}")
 
         # Record migration
         conn.execute(
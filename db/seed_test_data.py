@@ -3,7 +3,8 @@
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-import random
+
+import numpy as np
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -13,51 +14,67 @@ from cli.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# One PCG64 generator shared by all sample data, drawn from in bulk
+rng = np.random.default_rng()
+
+
+# 5-minute bars across market hours: 9:30 AM - 4:00 PM ET (390 minutes)
+BAR_MINUTES = np.arange(0, 390, 5)
+
 
 def generate_sample_bars(symbol: str, days: int = 30) -> list:
     """Generate sample OHLCV bars for testing."""
     bars = []
     base_price = {'TSLA': 250.0, 'IWM': 200.0, 'BTC/USD': 45000.0}.get(symbol, 100.0)
+    n = len(BAR_MINUTES)
 
     # Generate daily bars
     current_date = datetime.now(timezone.utc) - timedelta(days=days)
 
     for day in range(days):
-        # Market hours: 9:30 AM - 4:00 PM ET (390 minutes)
-        # Generate 78 5-minute bars per day
         date = current_date + timedelta(days=day)
 
         # Only generate for weekdays
         if date.weekday() >= 5:  # Saturday or Sunday
             continue
 
-        daily_open = base_price + random.uniform(-5, 5)
-        daily_trend = random.uniform(-2, 2)  # Daily trend
-
-        for minute in range(0, 390, 5):  # 5-minute bars
-            timestamp = date.replace(hour=9, minute=30) + timedelta(minutes=minute)
-
-            # Add some random walk
-            noise = random.uniform(-1, 1)
-            trend_component = (minute / 390) * daily_trend
-
-            open_price = daily_open + trend_component + noise
-            close_price = open_price + random.uniform(-0.5, 0.5)
-            high_price = max(open_price, close_price) + abs(random.uniform(0, 0.3))
-            low_price = min(open_price, close_price) - abs(random.uniform(0, 0.3))
-            volume = random.randint(100000, 1000000)
-
+        daily_open = base_price + rng.uniform(-5, 5)
+        daily_trend = rng.uniform(-2, 2)  # Daily trend
+
+        # Whole day of bars at once: random walk around the daily trend
+        noise = rng.uniform(-1, 1, n)
+        trend_component = (BAR_MINUTES / 390) * daily_trend
+
+        open_price = daily_open + trend_component + noise
+        close_price = open_price + rng.uniform(-0.5, 0.5, n)
+        high_price = np.maximum(open_price, close_price) + rng.uniform(0, 0.3, n)
+        low_price = np.minimum(open_price, close_price) - rng.uniform(0, 0.3, n)
+        vwap = (open_price + close_price) / 2
+        volume = rng.integers(100000, 1000000, n, endpoint=True)
+        trade_count = rng.integers(100, 500, n, endpoint=True)
+
+        market_open = date.replace(hour=9, minute=30)
+        for minute, o, h, l, c, v, vw, tc in zip(
+            BAR_MINUTES.tolist(),
+            np.round(open_price, 2).tolist(),
+            np.round(high_price, 2).tolist(),
+            np.round(low_price, 2).tolist(),
+            np.round(close_price, 2).tolist(),
+            volume.tolist(),
+            np.round(vwap, 2).tolist(),
+            trade_count.tolist()
+        ):
             bars.append({
                 'symbol': symbol,
-                'timestamp': timestamp,
+                'timestamp': market_open + timedelta(minutes=minute),
                 'timeframe': '5m',
-                'open': round(open_price, 2),
-                'high': round(high_price, 2),
-                'low': round(low_price, 2),
-                'close': round(close_price, 2),
-                'volume': volume,
-                'vwap': round((open_price + close_price) / 2, 2),
-                'trade_count': random.randint(100, 500)
+                'open': o,
+                'high': h,
+                'low': l,
+                'close': c,
+                'volume': v,
+                'vwap': vw,
+                'trade_count': tc
             })
 
         # Update base price for next day
@@ -68,11 +85,12 @@ def generate_sample_bars(symbol: str, days: int = 30) -> list:
 
 def generate_sample_sentiment(symbol: str, days: int = 30) -> list:
     """Generate sample sentiment data for testing."""
-    sentiments = []
     sources = ['news', 'reddit', 'sec']
 
     current_date = datetime.now(timezone.utc) - timedelta(days=days)
 
+    # Generate sentiment at market open and mid-day on weekdays
+    timestamps = []
     for day in range(days):
         date = current_date + timedelta(days=day)
 
@@ -80,37 +98,46 @@ def generate_sample_sentiment(symbol: str, days: int = 30) -> list:
         if date.weekday() >= 5:
             continue
 
-        # Generate sentiment at market open and mid-day
         for hour in [9, 14]:
-            timestamp = date.replace(hour=hour, minute=0, second=0)
-
-            for source in sources:
-                # Random sentiment
-                score = random.uniform(-0.5, 0.8)  # Slightly bullish bias
-                if score > 0.3:
-                    sentiment = 'positive'
-                elif score < -0.3:
-                    sentiment = 'negative'
-                else:
-                    sentiment = 'neutral'
-
-                confidence = random.uniform(0.5, 0.95)
-
-                sentiments.append({
-                    'symbol': symbol,
-                    'timestamp': timestamp,
-                    'source': source,
-                    'sentiment': sentiment,
-                    'score': round(score, 4),
-                    'confidence': round(confidence, 4),
-                    'metadata': {
-                        'article_count': random.randint(1, 10) if source == 'news' else None,
-                        'mention_count': random.randint(5, 50) if source == 'reddit' else None,
-                        'filing_count': random.randint(1, 3) if source == 'sec' else None
-                    }
-                })
-
-    return sentiments
+            timestamps.append(date.replace(hour=hour, minute=0, second=0))
+
+    # One row per (timestamp, source), drawn for all rows at once
+    n = len(timestamps) * len(sources)
+    if n == 0:
+        return []
+
+    scores = rng.uniform(-0.5, 0.8, n)  # Slightly bullish bias
+    labels = np.select([scores > 0.3, scores < -0.3], ['positive', 'negative'], default='neutral')
+    confidences = rng.uniform(0.5, 0.95, n)
+    article_counts = rng.integers(1, 10, n, endpoint=True)
+    mention_counts = rng.integers(5, 50, n, endpoint=True)
+    filing_counts = rng.integers(1, 3, n, endpoint=True)
+
+    return [
+        {
+            'symbol': symbol,
+            'timestamp': timestamp,
+            'source': source,
+            'sentiment': sentiment,
+            'score': score,
+            'confidence': confidence,
+            'metadata': {
+                'article_count': articles if source == 'news' else None,
+                'mention_count': mentions if source == 'reddit' else None,
+                'filing_count': filings if source == 'sec' else None
+            }
+        }
+        for timestamp, source, sentiment, score, confidence, articles, mentions, filings in zip(
+            [ts for ts in timestamps for _ in sources],
+            sources * len(timestamps),
+            labels.tolist(),
+            np.round(scores, 4).tolist(),
+            np.round(confidences, 4).tolist(),
+            article_counts.tolist(),
+            mention_counts.tolist(),
+            filing_counts.tolist()
+        )
+    ]
 
 
 def seed_data():
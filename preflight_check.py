@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Pre-flight check for paper trading - validates all trading decision components."""
+import io
+import logging
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -37,8 +41,11 @@ def test_market_data():
     try:
         broker = get_broker()
 
+        # Fetch all test quotes in one batch (one request per asset class)
+        quotes = broker.get_latest_quotes(["TSLA", "IWM", "BTC/USD"])
+
         # Test TSLA quote
-        tsla_quote = broker.get_latest_quote("TSLA")
+        tsla_quote = quotes.get("TSLA")
         if tsla_quote and 'ask' in tsla_quote:
             print_result("TSLA Quote", True, f"Price: ${tsla_quote['ask']:.2f}")
         else:
@@ -46,14 +53,14 @@ def test_market_data():
             return False
 
         # Test IWM quote
-        iwm_quote = broker.get_latest_quote("IWM")
+        iwm_quote = quotes.get("IWM")
         if iwm_quote and 'ask' in iwm_quote:
             print_result("IWM Quote", True, f"Price: ${iwm_quote['ask']:.2f}")
         else:
             print_result("IWM Quote", False, "Failed to fetch quote")
 
         # Test BTC quote
-        btc_quote = broker.get_latest_quote("BTC/USD")
+        btc_quote = quotes.get("BTC/USD")
         if btc_quote and 'ask' in btc_quote:
             print_result("BTC Quote", True, f"Price: ${btc_quote['ask']:.2f}")
         else:
@@ -123,10 +130,12 @@ def test_sentiment_analysis():
     """Test sentiment analysis from all sources."""
     print_section("3. SENTIMENT ANALYSIS")
 
+    # Sources are queried one after another: this check already runs
+    # alongside the others, and a nested pool's threads would bypass the
+    # per-check output capture in main()
     # Test News
     try:
-        news_analyzer = get_news_analyzer()
-        news_sentiment = news_analyzer.get_news_sentiment("TSLA", lookback_hours=24)
+        news_sentiment = get_news_analyzer().get_news_sentiment("TSLA", lookback_hours=24)
 
         if news_sentiment:
             score = news_sentiment.get('sentiment_score', 0)
@@ -140,8 +149,7 @@ def test_sentiment_analysis():
 
     # Test Reddit
     try:
-        reddit_analyzer = get_reddit_analyzer()
-        reddit_sentiment = reddit_analyzer.get_reddit_sentiment("TSLA", lookback_hours=24)
+        reddit_sentiment = get_reddit_analyzer().get_reddit_sentiment("TSLA", lookback_hours=24)
 
         if reddit_sentiment:
             score = reddit_sentiment.get('sentiment_score', 0)
@@ -155,8 +163,7 @@ def test_sentiment_analysis():
 
     # Test SEC
     try:
-        sec_analyzer = get_sec_analyzer()
-        sec_sentiment = sec_analyzer.get_sec_sentiment("TSLA", lookback_days=30)
+        sec_sentiment = get_sec_analyzer().get_sec_sentiment("TSLA", lookback_days=30)
 
         if sec_sentiment:
             score = sec_sentiment.get('sentiment_score', 0)
@@ -316,6 +323,60 @@ def test_full_decision_cycle():
         traceback.print_exc()
         return False
 
+
+CHECKS = [
+    ("Market Data", test_market_data),
+    ("Technical Analysis", test_technical_analysis),
+    ("Sentiment Analysis", test_sentiment_analysis),
+    ("Sentiment Aggregation", test_sentiment_aggregation),
+    ("Agent Configuration", test_agent_config),
+    ("Full Decision Cycle", test_full_decision_cycle),
+]
+
+# Checks share the Alpaca, news, Reddit and SEC rate limits, so only a few
+# run at once
+PREFLIGHT_WORKERS = 3
+
+
+class _ThreadOutput(io.TextIOBase):
+    """Stdout/stderr proxy that buffers writes from threads running a check."""
+
+    def __init__(self, stream, local=None):
+        self.stream = stream
+        # Share one thread-local with the stdout proxy so a check's stderr
+        # (e.g. traceback.print_exc()) lands in the same buffer, in order
+        self.local = local if local is not None else threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        (self.stream if buffer is None else buffer).write(text)
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def _retarget_log_handlers(streams):
+    """Point logging StreamHandlers at new streams; `streams` maps old stream -> new."""
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    for logger in loggers:
+        for handler in logger.handlers:
+            if isinstance(handler, logging.StreamHandler) and handler.stream in streams:
+                handler.setStream(streams[handler.stream])
+
+
+def _run_check(output, test_fn):
+    """Run one check with its printed output captured; returns (success, output)."""
+    output.local.buffer = io.StringIO()
+    try:
+        return test_fn(), output.local.buffer.getvalue()
+    finally:
+        output.local.buffer = None
+
+
 def main():
     """Run all pre-flight checks."""
     print("\n" + "="*80)
@@ -325,13 +386,27 @@ def main():
 
     results = []
 
-    # Run all tests
-    results.append(("Market Data", test_market_data()))
-    results.append(("Technical Analysis", test_technical_analysis()))
-    results.append(("Sentiment Analysis", test_sentiment_analysis()))
-    results.append(("Sentiment Aggregation", test_sentiment_aggregation()))
-    results.append(("Agent Configuration", test_agent_config()))
-    results.append(("Full Decision Cycle", test_full_decision_cycle()))
+    # Run tests concurrently (each is dominated by network I/O), then
+    # print their buffered output, stderr included, in the usual order
+    output = _ThreadOutput(sys.stdout)
+    errors = _ThreadOutput(sys.stderr, output.local)
+    sys.stdout, sys.stderr = output, errors
+    # Handlers created before the swap hold the real streams; route their
+    # log records through the per-thread buffers as well
+    _retarget_log_handlers({output.stream: output, errors.stream: errors})
+    try:
+        with ThreadPoolExecutor(max_workers=PREFLIGHT_WORKERS) as executor:
+            futures = [
+                executor.submit(_run_check, output, test_fn)
+                for _, test_fn in CHECKS
+            ]
+            for (test_name, _), future in zip(CHECKS, futures):
+                success, test_output = future.result()
+                output.stream.write(test_output)
+                results.append((test_name, success))
+    finally:
+        _retarget_log_handlers({output: output.stream, errors: errors.stream})
+        sys.stdout, sys.stderr = output.stream, errors.stream
 
     # Summary
     print_section("SUMMARY")
@@ -354,6 +429,7 @@ def main():
 
     return passed == total
 
+
 if __name__ == '__main__':
     success = main()
     sys.exit(0 if success else 1)
@@ -0,0 +1,165 @@
+"""
+Tests for resuming a backfill from bars already in the database.
+
+Runs against a temporary SQLite database created by the migration runner.
+"""
+import importlib.util
+import logging
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from ztrade.core.database import market_data_store
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def load_script(name):
+    """Import a script from db/ by path (db/ is not a package)."""
+    spec = importlib.util.spec_from_file_location(name, PROJECT_ROOT / 'db' / f'{name}.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """Migrated database at a temporary DATABASE_PATH."""
+    monkeypatch.setenv('DATABASE_PATH', str(tmp_path / 'ztrade.db'))
+    assert load_script('migrate').run_migrations()
+    return tmp_path / 'ztrade.db'
+
+
+def store_bars(symbol, timeframe, timestamps):
+    market_data_store.insert_bar_rows([
+        (symbol, ts, timeframe, 1.0, 1.0, 1.0, 1.0, 100, None, None) for ts in timestamps
+    ])
+
+
+END = datetime(2025, 6, 30, 20, 0, tzinfo=timezone.utc)
+START = END - timedelta(days=30)
+
+
+def test_timestamp_range_empty(database):
+    assert market_data_store.get_timestamp_range('AAA', '1d') == (None, None)
+
+
+def test_timestamp_range(database):
+    store_bars('AAA', '1d', [START + timedelta(days=d) for d in (3, 1, 10)])
+    store_bars('AAA', '1h', [START])
+
+    earliest, latest = market_data_store.get_timestamp_range('AAA', '1d')
+    assert earliest == START + timedelta(days=1)
+    assert latest == START + timedelta(days=10)
+
+
+class RecordingBroker:
+    """Broker stub recording the date range of each get_bars request."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get_bars(self, symbol, timeframe, limit, start, end):
+        self.requests.append((datetime.fromisoformat(start), datetime.fromisoformat(end)))
+        return []
+
+
+# Legacy cli.utils providers the backfill script imports, with the factory
+# each must expose; none are called by these tests
+CLI_MODULES = {
+    'cli.utils.broker': 'get_broker',
+    'cli.utils.alphavantage_provider': 'get_alphavantage_provider',
+    'cli.utils.coingecko_provider': 'get_coingecko_provider',
+    'cli.utils.sentiment_aggregator': 'get_sentiment_aggregator',
+}
+
+
+def unused_provider():
+    raise AssertionError('backfill tests pass their own broker')
+
+
+@pytest.fixture
+def backfill(database, monkeypatch):
+    """Backfill script loaded with stub cli.utils modules."""
+    for name in ('cli', 'cli.utils'):
+        monkeypatch.setitem(sys.modules, name, types.ModuleType(name))
+    for name, factory in CLI_MODULES.items():
+        module = types.ModuleType(name)
+        setattr(module, factory, unused_provider)
+        monkeypatch.setitem(sys.modules, name, module)
+    logger_module = types.ModuleType('cli.utils.logger')
+    logger_module.get_logger = logging.getLogger
+    monkeypatch.setitem(sys.modules, 'cli.utils.logger', logger_module)
+    return load_script('backfill_historical_data')
+
+
+def test_resumes_after_latest_when_start_covered(backfill):
+    store_bars('AAA', '1d', [START + timedelta(days=d) for d in range(0, 20)])
+    broker = RecordingBroker()
+
+    backfill.fetch_bars_for_period(broker, 'AAA', '1d', START, END)
+    assert broker.requests[0][0] == START + timedelta(days=20)
+
+
+def test_refetches_range_not_covered_by_stored_bars(backfill):
+    """Bars from a shorter earlier run don't hide the older part of the range."""
+    store_bars('AAA', '1d', [END - timedelta(days=d) for d in range(1, 5)])
+    broker = RecordingBroker()
+
+    backfill.fetch_bars_for_period(broker, 'AAA', '1d', START, END)
+    assert broker.requests[0][0] == START
+
+
+def test_skips_when_up_to_date(backfill):
+    store_bars('AAA', '1d', [START, END])
+    broker = RecordingBroker()
+
+    assert backfill.fetch_bars_for_period(broker, 'AAA', '1d', START, END) == []
+    assert broker.requests == []
+
+
+def test_stored_start_within_slack_counts_as_covered(backfill):
+    """A first bar a few days after start_date (weekend, holiday) still resumes."""
+    first = START + backfill.RESUME_COVERAGE_SLACK
+    store_bars('AAA', '1d', [first, first + timedelta(days=1)])
+    broker = RecordingBroker()
+
+    backfill.fetch_bars_for_period(broker, 'AAA', '1d', START, END)
+    assert broker.requests[0][0] == first + timedelta(days=2)
+
+
+def test_stored_start_beyond_slack_refetches(backfill):
+    first = START + backfill.RESUME_COVERAGE_SLACK + timedelta(days=1)
+    store_bars('AAA', '1d', [first, first + timedelta(days=1)])
+    broker = RecordingBroker()
+
+    backfill.fetch_bars_for_period(broker, 'AAA', '1d', START, END)
+    assert broker.requests[0][0] == START
+
+
+class ChunkBroker(RecordingBroker):
+    """Broker stub returning one bar per request, stamped with its start."""
+
+    def get_bars(self, symbol, timeframe, limit, start, end):
+        super().get_bars(symbol, timeframe, limit, start, end)
+        return [{'timestamp': start}]
+
+
+@pytest.mark.parametrize('pooled', [False, True])
+def test_paginated_chunks_in_date_order(backfill, pooled):
+    """Chunks come back in date order whether fetched serially or on the run's pool."""
+    broker = ChunkBroker()
+    start = END - timedelta(days=100)
+
+    with ThreadPoolExecutor(max_workers=backfill.CHUNK_WORKERS) as pool:
+        bars = backfill.fetch_bars_for_period(
+            broker, 'AAA', '1m', start, END, chunk_executor=pool if pooled else None
+        )
+
+    starts = [bar['timestamp'] for bar in bars]
+    assert len(starts) == len(broker.requests) == 4
+    assert starts == sorted(starts)
+    assert starts[0] == start.isoformat()
@@ -0,0 +1,85 @@
+"""
+Tests for the SQL migration runner.
+
+Each migration file and its schema_migrations row must commit together or
+not at all, so a failed migration can be fixed and re-run.
+"""
+import importlib.util
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "migrate", Path(__file__).parent.parent / "db" / "migrate.py"
+)
+migrate = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(migrate)
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(tmp_path / "test.db")
+    migrate.create_migrations_table(conn)
+    yield conn
+    conn.close()
+
+
+def tables(conn):
+    rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    return {name for (name,) in rows}
+
+
+def test_migration_applied_and_recorded(conn, tmp_path):
+    (tmp_path / "001_ok.sql").write_text(
+        "CREATE TABLE a (id INTEGER);\nINSERT INTO a VALUES (1);\n"
+    )
+
+    assert migrate.apply_migration(conn, tmp_path, "001_ok.sql")
+
+    assert "a" in tables(conn)
+    assert migrate.get_applied_migrations(conn) == {"001_ok.sql"}
+
+
+def test_failed_migration_rolls_back_every_statement(conn, tmp_path):
+    (tmp_path / "002_bad.sql").write_text(
+        "CREATE TABLE b (id INTEGER);\n"
+        "INSERT INTO b VALUES (1);\n"
+        "INSERT INTO missing_table VALUES (1);\n"
+    )
+
+    with pytest.raises(sqlite3.Error):
+        migrate.apply_migration(conn, tmp_path, "002_bad.sql")
+
+    assert "b" not in tables(conn)
+    assert migrate.get_applied_migrations(conn) == set()
+
+
+def test_failed_migration_can_be_rerun(conn, tmp_path):
+    path = tmp_path / "003_retry.sql"
+    path.write_text("CREATE TABLE c (id INTEGER);\nSELECT * FROM nope;\n")
+    with pytest.raises(sqlite3.Error):
+        migrate.apply_migration(conn, tmp_path, "003_retry.sql")
+
+    path.write_text("CREATE TABLE c (id INTEGER);\n")
+    assert migrate.apply_migration(conn, tmp_path, "003_retry.sql")
+    assert "c" in tables(conn)
+    assert migrate.get_applied_migrations(conn) == {"003_retry.sql"}
+
+
+def test_run_migrations_on_fresh_database(tmp_path, monkeypatch):
+    db_path = tmp_path / "ztrade.db"
+    monkeypatch.setenv("DATABASE_PATH", str(db_path))
+
+    assert migrate.run_migrations()
+    assert migrate.run_migrations()  # Nothing pending the second time
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert "market_bars" in tables(conn)
+        applied = migrate.get_applied_migrations(conn)
+    finally:
+        conn.close()
+    assert applied == {
+        p.name for p in (Path(migrate.__file__).parent / "migrations").glob("*.sql")
+    }
@@ -0,0 +1,93 @@
+"""
+Tests for the shared token-bucket rate limiter.
+
+A fake clock replaces time.monotonic/time.sleep so pacing is checked
+exactly and instantly.
+"""
+import threading
+import time
+
+import pytest
+from ztrade.core import rate_limit
+from ztrade.core.rate_limit import TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only advances when something sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(rate_limit.time, 'sleep', clock.sleep)
+    return clock
+
+
+def test_burst_up_to_capacity_without_waiting(clock):
+    bucket = TokenBucket(10)
+    for _ in range(10):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+
+def test_paced_at_refill_rate_once_empty(clock):
+    bucket = TokenBucket(10)
+    for _ in range(15):
+        bucket.acquire()
+
+    # 5 requests past the burst need 5 refills of 0.1s each
+    assert sum(clock.sleeps) == pytest.approx(0.5)
+
+
+def test_rate_per_minute(clock):
+    bucket = TokenBucket(5, per=60)
+    for _ in range(6):
+        bucket.acquire()
+    assert sum(clock.sleeps) == pytest.approx(12.0)
+
+
+def test_refills_while_idle_up_to_capacity(clock):
+    bucket = TokenBucket(10, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 60  # Long idle period still only refills to capacity
+
+    for _ in range(3):
+        bucket.acquire()
+    assert sum(clock.sleeps) == pytest.approx(0.1)
+
+
+def test_shared_across_threads():
+    """Concurrent workers are paced as a whole, not per thread."""
+    bucket = TokenBucket(200, capacity=20)
+    taken = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(10):
+            bucket.acquire()
+            with lock:
+                taken.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 20 go out as the initial burst; the other 20 wait for refills at 200/s
+    assert len(taken) == 40
+    assert time.monotonic() - start >= 20 / 200 * 0.95
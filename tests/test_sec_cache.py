@@ -0,0 +1,132 @@
+"""
+Tests for the SEC analyzer's on-disk response cache.
+
+The HTTP session is replaced by a stub, so these run offline against a
+temporary cache directory.
+"""
+import json
+import threading
+import time
+
+import pytest
+from ztrade.sentiment.sec import SECAnalyzer
+
+
+class StubResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.content = json.dumps(payload).encode() if payload is not None else b""
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+
+class StubSession:
+    """Session that answers every GET with the next queued response."""
+
+    def __init__(self, *responses, delay=0.0):
+        self.responses = list(responses)
+        self.requests = []
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, timeout=None):
+        with self._lock:
+            self.requests.append((url, headers or {}))
+            response = self.responses.pop(0)
+        time.sleep(self.delay)
+        return response
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    """SEC analyzer caching under tmp_path, with throttling disabled."""
+    monkeypatch.setattr(SECAnalyzer, 'CACHE_DIR', tmp_path / 'sec')
+    monkeypatch.setattr(SECAnalyzer, '_json_memo', {})
+    monkeypatch.setattr(SECAnalyzer, '_throttle', lambda self: None)
+    return SECAnalyzer()
+
+
+URL = f"{SECAnalyzer.SEC_API_BASE}/files/company_tickers.json"
+TICKERS = {"0": {"cik_str": 1318605, "ticker": "TSLA"}}
+
+
+def test_cache_dir_anchored_to_project_root():
+    assert SECAnalyzer.CACHE_DIR.is_absolute()
+    assert (SECAnalyzer.CACHE_DIR.parent.parent / 'ztrade' / 'sentiment' / 'sec.py').exists()
+
+
+def test_fresh_entry_served_without_request(analyzer):
+    analyzer.session = StubSession(StubResponse(200, TICKERS, {'ETag': '"v1"'}))
+
+    assert analyzer._get_json(URL, max_age=3600) == TICKERS
+    assert analyzer._get_json(URL, max_age=3600) == TICKERS
+    assert len(analyzer.session.requests) == 1
+
+    files = sorted(p.name for p in SECAnalyzer.CACHE_DIR.iterdir())
+    assert files == ['company_tickers.json', 'company_tickers.json.meta']
+
+
+def test_stale_entry_revalidated_with_etag(analyzer):
+    analyzer.session = StubSession(
+        StubResponse(200, TICKERS, {'ETag': '"v1"'}),
+        StubResponse(304),
+    )
+
+    analyzer._get_json(URL, max_age=0)
+    assert analyzer._get_json(URL, max_age=0) == TICKERS
+
+    _, headers = analyzer.session.requests[1]
+    assert headers['If-None-Match'] == '"v1"'
+
+
+def test_body_without_meta_is_refetched(analyzer):
+    analyzer.session = StubSession(
+        StubResponse(200, TICKERS, {'ETag': '"v1"'}),
+        StubResponse(200, TICKERS, {'ETag': '"v2"'}),
+    )
+    analyzer._get_json(URL, max_age=3600)
+    (SECAnalyzer.CACHE_DIR / 'company_tickers.json.meta').unlink()
+
+    analyzer._get_json(URL, max_age=3600)
+    _, headers = analyzer.session.requests[1]
+    assert 'If-None-Match' not in headers
+
+
+def test_concurrent_misses_issue_one_request(analyzer):
+    analyzer.session = StubSession(
+        *[StubResponse(200, TICKERS, {'ETag': '"v1"'}) for _ in range(8)], delay=0.05
+    )
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(analyzer._get_json(URL, max_age=3600)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [TICKERS] * 8
+    assert len(analyzer.session.requests) == 1
+
+
+def test_failed_write_leaves_previous_body(analyzer, monkeypatch):
+    analyzer.session = StubSession(StubResponse(200, TICKERS, {'ETag': '"v1"'}))
+    analyzer._get_json(URL, max_age=0)
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr('ztrade.sentiment.sec.os.replace', fail)
+    analyzer.session = StubSession(StubResponse(200, {"changed": True}, {'ETag': '"v2"'}))
+    assert analyzer._get_json(URL, max_age=0) == {"changed": True}
+
+    body = SECAnalyzer.CACHE_DIR / 'company_tickers.json'
+    assert json.loads(body.read_text()) == TICKERS
+    assert [p.name for p in SECAnalyzer.CACHE_DIR.iterdir() if p.suffix == '.tmp'] == []
@@ -0,0 +1,81 @@
+"""
+Tests for selecting recent filings from SEC submissions data.
+
+The submissions document is stubbed, so these run offline.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from ztrade.sentiment.sec import Filing, SECAnalyzer
+
+
+def days_ago(days):
+    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture
+def analyzer():
+    return SECAnalyzer()
+
+
+def with_submissions(analyzer, monkeypatch, rows):
+    """Serve rows of (form, filingDate) as the submissions document, newest first."""
+    recent = {
+        "form": [form for form, _ in rows],
+        "filingDate": [date for _, date in rows],
+        "accessionNumber": [f"acc-{i}" for i in range(len(rows))],
+        "primaryDocument": [f"doc-{i}.htm" for i in range(len(rows))],
+    }
+
+    def get_json(url, max_age, extract=None):
+        if url.endswith("company_tickers.json"):
+            return {}  # No symbols beyond the pre-populated CIK cache
+        return {"filings": {"recent": recent}}
+
+    monkeypatch.setattr(analyzer, '_get_json', get_json)
+
+
+def test_filings_within_lookback_returned(analyzer, monkeypatch):
+    with_submissions(analyzer, monkeypatch, [
+        ("8-K", days_ago(1)),
+        ("10-Q", days_ago(5)),
+        ("8-K", days_ago(60)),
+    ])
+
+    filings = analyzer._get_recent_filings("0000000001", lookback_days=30, max_filings=10)
+    assert [f.accession_number for f in filings] == ["acc-0", "acc-1"]
+
+
+@pytest.mark.parametrize("bad_date", ["", "not-a-date", "2025/01/01", None])
+def test_malformed_date_does_not_end_window(analyzer, monkeypatch, bad_date):
+    """A bad date among recent filings is skipped without hiding later ones."""
+    # The bad date sits at the first bisection midpoint
+    with_submissions(analyzer, monkeypatch, [
+        ("8-K", days_ago(1)),
+        ("10-Q", days_ago(2)),
+        ("8-K", days_ago(3)),
+        ("8-K", bad_date),
+        ("8-K", days_ago(4)),
+        ("10-K", days_ago(5)),
+        ("10-K", days_ago(90)),
+    ])
+
+    filings = analyzer._get_recent_filings("0000000001", lookback_days=30, max_filings=10)
+    assert [f.accession_number for f in filings] == ["acc-0", "acc-1", "acc-2", "acc-4", "acc-5"]
+
+
+def score(analyzer, description, form="8-K"):
+    return analyzer._analyze_filing_sentiment(Filing(form, days_ago(1), "acc", "doc.htm", description))
+
+
+@pytest.mark.parametrize("description, expected", [
+    ("Earnings missed estimates", -0.2),
+    ("Revenue beats; growth exceeded guidance", 0.6),
+    ("Net losses widened", -0.2),
+    ("Guidance raised", 0.2),
+    # Whole words only: no keyword inside longer words
+    ("Missing exhibit to Commission mission statement", 0.0),
+    ("Beatrice Foods recordkeeping", 0.0),
+])
+def test_keyword_matching(analyzer, description, expected):
+    assert score(analyzer, description) == pytest.approx(expected)
@@ -0,0 +1,103 @@
+"""
+Tests for the sentiment aggregator's result cache.
+
+Only the news source is enabled, backed by a stub analyzer that counts
+how often it is asked, so no external API is touched.
+"""
+import pytest
+from ztrade.sentiment import aggregator as aggregator_module
+from ztrade.sentiment.aggregator import SentimentAggregator
+
+
+class StubNewsAnalyzer:
+    """News analyzer returning a fixed positive result."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_news_sentiment(self, symbol, lookback_hours=24, max_articles=25):
+        self.calls += 1
+        return {
+            'overall_sentiment': 'positive',
+            'sentiment_score': 0.5,
+            'confidence': 0.8,
+            'article_count': 3,
+        }
+
+
+@pytest.fixture
+def news(monkeypatch):
+    """Stub news analyzer, with Redis disabled and an empty local cache."""
+    stub = StubNewsAnalyzer()
+    monkeypatch.setattr(aggregator_module, 'get_news_analyzer', lambda: stub)
+    monkeypatch.delenv('REDIS_URL', raising=False)
+    monkeypatch.setattr(aggregator_module, '_local_cache', {})
+    return stub
+
+
+def make_aggregator(**kwargs):
+    return SentimentAggregator(enable_reddit=False, enable_sec=False, **kwargs)
+
+
+def test_cache_disabled_by_default(news):
+    aggregator = make_aggregator()
+    aggregator.get_aggregated_sentiment('TSLA')
+    aggregator.get_aggregated_sentiment('TSLA')
+
+    assert news.calls == 2
+    assert aggregator_module._local_cache == {}
+
+
+def test_cached_result_reused_within_ttl(news):
+    aggregator = make_aggregator(use_cache=True)
+    first = aggregator.get_aggregated_sentiment('TSLA')
+    second = aggregator.get_aggregated_sentiment('TSLA')
+
+    assert news.calls == 1
+    assert second == first
+
+
+def test_expired_entry_refetched(news, monkeypatch):
+    aggregator = make_aggregator(use_cache=True)
+    aggregator.get_aggregated_sentiment('TSLA')
+
+    # Age the entry past its TTL without leaving the hour bucket
+    key, (expires_at, result) = next(iter(aggregator_module._local_cache.items()))
+    aggregator_module._local_cache[key] = (expires_at - SentimentAggregator.CACHE_TTL_SECONDS - 1, result)
+
+    aggregator.get_aggregated_sentiment('TSLA')
+    assert news.calls == 2
+
+
+def test_cached_result_is_a_copy(news):
+    aggregator = make_aggregator(use_cache=True)
+    first = aggregator.get_aggregated_sentiment('TSLA')
+    first['sources_used'].append('tampered')
+    first['source_breakdown']['news']['sentiment_score'] = -1.0
+
+    second = aggregator.get_aggregated_sentiment('TSLA')
+    assert second['sources_used'] == ['news']
+    assert second['source_breakdown']['news']['sentiment_score'] == 0.5
+
+    second['overall_sentiment'] = 'negative'
+    assert aggregator.get_aggregated_sentiment('TSLA')['overall_sentiment'] == 'positive'
+
+
+def test_expired_entries_purged_on_write(news):
+    aggregator_module._local_cache['stale'] = (0.0, {})
+    make_aggregator(use_cache=True).get_aggregated_sentiment('TSLA')
+
+    assert 'stale' not in aggregator_module._local_cache
+    assert len(aggregator_module._local_cache) == 1
+
+
+def test_local_cache_size_bounded(news, monkeypatch):
+    monkeypatch.setattr(aggregator_module, 'LOCAL_CACHE_MAX_ENTRIES', 3)
+    aggregator = make_aggregator(use_cache=True)
+    for symbol in ['AAPL', 'MSFT', 'TSLA', 'NVDA', 'AMZN']:
+        aggregator.get_aggregated_sentiment(symbol)
+
+    keys = list(aggregator_module._local_cache)
+    assert len(keys) == 3
+    assert any(':AMZN:' in key for key in keys)
+    assert not any(':AAPL:' in key for key in keys)
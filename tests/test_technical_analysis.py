@@ -0,0 +1,54 @@
+"""
+Tests for technical analysis results.
+"""
+import dataclasses
+
+import pytest
+from ztrade.analysis.technical import SignalType, TechnicalAnalysis, TechnicalSignal
+
+
+@pytest.fixture
+def analysis():
+    return TechnicalAnalysis(
+        symbol="TSLA",
+        timestamp="2025-01-02T10:00:00",
+        signals=[TechnicalSignal("rsi", SignalType.BULLISH, 0.8, 25.0, "oversold")],
+        overall_signal=SignalType.BULLISH,
+        overall_confidence=0.8,
+        computation_time_ms=1.234,
+    )
+
+
+def test_to_dict(analysis):
+    assert analysis.to_dict() == {
+        "symbol": "TSLA",
+        "timestamp": "2025-01-02T10:00:00",
+        "overall_signal": "bullish",
+        "overall_confidence": 0.8,
+        "computation_time_ms": 1.23,
+        "signals": [{
+            "indicator": "rsi",
+            "signal": "bullish",
+            "confidence": 0.8,
+            "value": 25.0,
+            "reasoning": "oversold",
+        }],
+    }
+
+
+def test_to_dict_result_can_be_modified(analysis):
+    first = analysis.to_dict()
+    first["overall_signal"] = "bearish"
+    first["signals"][0]["signal"] = "bearish"
+    first["signals"].append({})
+
+    second = analysis.to_dict()
+    assert second["overall_signal"] == "bullish"
+    assert second["signals"] == [analysis.to_dict()["signals"][0]]
+    assert second["signals"][0]["signal"] == "bullish"
+
+
+def test_fields_cannot_be_reassigned(analysis):
+    analysis.to_dict()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        analysis.overall_signal = SignalType.BEARISH
@@ -0,0 +1,146 @@
+"""
+Tests for trade execution state and logging.
+
+Agent state and the trade logs are read by other processes (risk checks,
+the dashboard), so they must be on disk by the time execute_trade returns.
+"""
+import json
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("alpaca_trade_api")
+
+from ztrade.core.config import Config
+from ztrade.execution import trade_executor
+from ztrade.execution.trade_executor import TradeExecutor
+
+
+class FakeBroker:
+    """Broker that fills every order immediately."""
+
+    def __init__(self):
+        self.orders = []
+
+    def submit_order(self, **order):
+        self.orders.append(order)
+        return {'id': f"order-{len(self.orders)}", 'filled_avg_price': 100.0}
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Project directory with one agent, used as the working directory."""
+    agent_dir = tmp_path / "agents" / "agent_test"
+    agent_dir.mkdir(parents=True)
+    (agent_dir / "context.yaml").write_text("agent:\n  asset: TSLA\n")
+    (agent_dir / "state.json").write_text(json.dumps({'trades_today': 0, 'positions': []}))
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(trade_executor, 'get_broker', FakeBroker)
+    return tmp_path
+
+
+def buy(quantity=1):
+    return {'action': 'buy', 'quantity': quantity, 'stop_loss': 95.0}
+
+
+def test_state_visible_to_new_executor(workspace):
+    """A second executor (e.g. the next Airflow task) sees the first trade."""
+    result = TradeExecutor().execute_trade('agent_test', buy(), current_price=100.0)
+    assert result['success']
+
+    state = Config(str(workspace)).load_agent_state('agent_test')
+    assert state['trades_today'] == 1
+    assert len(state['positions']) == 1
+
+    TradeExecutor().execute_trade('agent_test', buy(), current_price=100.0)
+    state = Config(str(workspace)).load_agent_state('agent_test')
+    assert state['trades_today'] == 2
+
+
+def test_state_update_keeps_other_writers_changes(workspace):
+    """State is re-read before each update instead of overwritten from memory."""
+    executor = TradeExecutor()
+    executor.execute_trade('agent_test', buy(), current_price=100.0)
+
+    config = Config(str(workspace))
+    state = config.load_agent_state('agent_test')
+    state['daily_loss'] = 42.0
+    config.save_agent_state('agent_test', state)
+
+    executor.execute_trade('agent_test', {'action': 'sell', 'quantity': 1}, current_price=100.0)
+
+    state = config.load_agent_state('agent_test')
+    assert state['daily_loss'] == 42.0
+    assert state['trades_today'] == 2
+    assert state['positions'] == []
+
+
+def test_logs_written_before_execute_trade_returns(workspace):
+    """Trade and decision records are on disk without an explicit flush/close."""
+    TradeExecutor().execute_trade('agent_test', buy(), current_price=100.0)
+
+    trade_logs = list((workspace / "logs" / "trades").glob("*.jsonl"))
+    decision_logs = list((workspace / "logs" / "agent_decisions").glob("agent_test_*.jsonl"))
+    assert len(trade_logs) == 1
+    assert len(decision_logs) == 1
+
+    decision = json.loads(decision_logs[0].read_text().splitlines()[-1])
+    assert decision['result']['success']
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_decision_with_numpy_and_nan_values_logged(workspace, monkeypatch, use_orjson):
+    """Indicator outputs are numpy scalars and may be NaN; both must reach the log intact."""
+    if not use_orjson:
+        monkeypatch.setattr(trade_executor, 'orjson', None)
+    decision = {
+        'action': 'hold',
+        'quantity': np.int64(0),
+        'indicators': {'rsi': np.float32(55.5), 'sma_200': float('nan')},
+    }
+    executor = TradeExecutor()
+    executor.execute_trade('agent_test', decision, current_price=100.0)
+    executor.execute_trade('agent_test', {'action': 'hold', 'quantity': np.int64(1)}, current_price=100.0)
+
+    log_file = next((workspace / "logs" / "agent_decisions").glob("agent_test_*.jsonl"))
+    first, second = (json.loads(line) for line in log_file.read_text().splitlines())
+    assert first['decision']['quantity'] == 0
+    assert first['decision']['indicators']['rsi'] == 55.5
+    assert math.isnan(first['decision']['indicators']['sma_200'])
+    assert second['decision']['quantity'] == 1
+
+
+def test_log_flush_error_does_not_fail_trade(workspace):
+    """A full disk is logged, not raised, and never blocks execute_trade."""
+    executor = TradeExecutor()
+    executor.execute_trade('agent_test', {'action': 'hold'}, current_price=100.0)
+
+    class FullDisk:
+        def write(self, data):
+            return len(data)
+
+        def flush(self):
+            raise OSError(28, "No space left on device")
+
+        def close(self):
+            self.flush()
+
+    for path in list(executor._log_handles):
+        executor._log_handles[path] = FullDisk()
+
+    result = executor.execute_trade('agent_test', buy(), current_price=100.0)
+    assert result['success']
+    executor.close()
+    assert executor._log_handles == {}
+
+
+def test_new_day_closes_previous_log_files(workspace):
+    executor = TradeExecutor()
+    executor.execute_trade('agent_test', {'action': 'hold'}, current_price=100.0)
+    handles = list(executor._log_handles.values())
+
+    executor._rotate_log_paths('2099-01-01')
+    assert executor._log_handles == {}
+    assert all(handle.closed for handle in handles)
@@ -8,8 +8,9 @@ Purpose: Optimize decision-making by pre-computing TA signals so the LLM
 only needs to synthesize pre-digested information instead of raw numbers.
 """
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 import time
 from ztrade.core.logger import get_logger
 
@@ -23,7 +24,14 @@ class SignalType(Enum):
     NEUTRAL = "neutral"
 
 
-@dataclass
+# Integer signal codes, used by TechnicalSignal.signal_tag for voting
+SIGNAL_CODES = (SignalType.BULLISH, SignalType.BEARISH, SignalType.NEUTRAL)
+_SIGNAL_TAGS = {signal: code for code, signal in enumerate(SIGNAL_CODES)}
+_BULLISH_TAG = _SIGNAL_TAGS[SignalType.BULLISH]
+_BEARISH_TAG = _SIGNAL_TAGS[SignalType.BEARISH]
+
+
+@dataclass(slots=True)
 class TechnicalSignal:
     """A single technical analysis signal with confidence score."""
     indicator: str  # e.g., "rsi", "macd", "sma_crossover"
@@ -31,9 +39,30 @@ class TechnicalSignal:
     confidence: float  # 0.0 to 1.0
     value: Optional[float] = None  # The actual indicator value
     reasoning: str = ""  # Human-readable explanation
+    signal_str: str = field(init=False, repr=False)  # Cached signal.value for serialization
+    signal_tag: int = field(init=False, repr=False)  # Index into SIGNAL_CODES for voting
+
+    def __post_init__(self):
+        self.signal_str = self.signal.value
+        self.signal_tag = _SIGNAL_TAGS[self.signal]
+
+
+_signal_fields = attrgetter("indicator", "signal_str", "confidence", "value", "reasoning")
+
 
+def _signal_to_dict(signal: TechnicalSignal) -> Dict[str, Any]:
+    """Serialize a TechnicalSignal for logging/LLM consumption."""
+    indicator, signal_str, confidence, value, reasoning = _signal_fields(signal)
+    return {
+        "indicator": indicator,
+        "signal": signal_str,
+        "confidence": round(confidence, 2),
+        "value": value,
+        "reasoning": reasoning
+    }
 
-@dataclass
+
+@dataclass(frozen=True)
 class TechnicalAnalysis:
     """Complete technical analysis with multiple signals."""
     symbol: str
@@ -42,26 +71,29 @@ class TechnicalAnalysis:
     overall_signal: SignalType
     overall_confidence: float
     computation_time_ms: float
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for logging/LLM consumption."""
-        return {
-            "symbol": self.symbol,
-            "timestamp": self.timestamp,
-            "overall_signal": self.overall_signal.value,
-            "overall_confidence": round(self.overall_confidence, 2),
-            "computation_time_ms": round(self.computation_time_ms, 2),
-            "signals": [
-                {
-                    "indicator": s.indicator,
-                    "signal": s.signal.value,
-                    "confidence": round(s.confidence, 2),
-                    "value": s.value,
-                    "reasoning": s.reasoning
-                }
-                for s in self.signals
-            ]
-        }
+        """
+        Convert to dictionary for logging/LLM consumption.
+
+        Fields are frozen, so the serialized form is built once; each call
+        returns a fresh copy that the caller is free to modify.
+        """
+        cached = self._dict_cache
+        if cached is None:
+            cached = {
+                "symbol": self.symbol,
+                "timestamp": self.timestamp,
+                "overall_signal": self.overall_signal.value,
+                "overall_confidence": round(self.overall_confidence, 2),
+                "computation_time_ms": round(self.computation_time_ms, 2),
+                "signals": list(map(_signal_to_dict, self.signals))
+            }
+            object.__setattr__(self, "_dict_cache", cached)
+        return {**cached, "signals": [dict(signal) for signal in cached["signals"]]}
 
 
 class TechnicalAnalyzer:
@@ -72,6 +104,15 @@ class TechnicalAnalyzer:
     All calculations are transparent and auditable.
     """
 
+    # Price action pattern -> (signal, confidence, reasoning)
+    PATTERN_SIGNALS = {
+        "strong_uptrend": (SignalType.BULLISH, 0.85, "Strong uptrend (higher highs and lows)"),
+        "strong_downtrend": (SignalType.BEARISH, 0.85, "Strong downtrend (lower highs and lows)"),
+        "bullish_consolidation": (SignalType.BULLISH, 0.65, "Bullish consolidation (higher lows)"),
+        "bearish_consolidation": (SignalType.BEARISH, 0.65, "Bearish consolidation (lower highs)"),
+        "choppy": (SignalType.NEUTRAL, 0.3, "Choppy price action - no clear pattern"),
+    }
+
     def _analyze_baseline(self, market_context: Dict[str, Any]) -> TechnicalAnalysis:
         """
         Baseline technical analysis (original implementation).
@@ -82,12 +123,13 @@ class TechnicalAnalyzer:
         Returns:
             TechnicalAnalysis with baseline signal logic
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         symbol = market_context.get("symbol", "UNKNOWN")
         timestamp = market_context.get("timestamp", "")
 
         signals: List[TechnicalSignal] = []
+        append = signals.append
 
         # Extract indicators from market context
         indicators = market_context.get("technical_indicators", {})
@@ -99,34 +141,34 @@ class TechnicalAnalyzer:
 
         # RSI Signal
         if "rsi_14" in indicators:
-            signals.append(self._analyze_rsi(indicators["rsi_14"]))
+            append(self._analyze_rsi(indicators["rsi_14"]))
 
         # SMA Signal (price vs moving average)
         if "price_vs_sma20" in indicators:
-            signals.append(
+            append(
                 self._analyze_sma_position(indicators["price_vs_sma20"], indicators.get("sma_20"))
             )
 
         # Trend Signal
         if trend and trend.get("trend") != "unknown":
-            signals.append(self._analyze_trend(trend))
+            append(self._analyze_trend(trend))
 
         # Support/Resistance Signal
         if levels and current_price > 0:
-            signals.append(self._analyze_levels(levels, current_price))
+            append(self._analyze_levels(levels, current_price))
 
         # Volume Signal
         if volume and volume.get("volume_trend") != "unknown":
-            signals.append(self._analyze_volume(volume))
+            append(self._analyze_volume(volume))
 
         # Price Action Signal
         if price_action and "pattern" in price_action:
-            signals.append(self._analyze_price_action(price_action))
+            append(self._analyze_price_action(price_action))
 
         # Calculate overall signal and confidence
         overall_signal, overall_confidence = self._synthesize_signals(signals)
 
-        computation_time_ms = (time.time() - start_time) * 1000
+        computation_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         analysis = TechnicalAnalysis(
             symbol=symbol,
@@ -138,8 +180,8 @@ class TechnicalAnalyzer:
         )
 
         logger.info(
-            f"[BASELINE] Technical analysis for {symbol}: {overall_signal.value} "
-            f"(confidence: {overall_confidence:.2f}) in {computation_time_ms:.1f}ms"
+            "[BASELINE] Technical analysis for %s: %s (confidence: %.2f) in %.1fms",
+            symbol, overall_signal.value, overall_confidence, computation_time_ms
         )
 
         return analysis
@@ -312,17 +354,11 @@ class TechnicalAnalyzer:
         """Analyze price action patterns."""
         pattern = price_action.get("pattern", "choppy")
 
-        pattern_signals = {
-            "strong_uptrend": (SignalType.BULLISH, 0.85, "Strong uptrend (higher highs and lows)"),
-            "strong_downtrend": (SignalType.BEARISH, 0.85, "Strong downtrend (lower highs and lows)"),
-            "bullish_consolidation": (SignalType.BULLISH, 0.65, "Bullish consolidation (higher lows)"),
-            "bearish_consolidation": (SignalType.BEARISH, 0.65, "Bearish consolidation (lower highs)"),
-            "choppy": (SignalType.NEUTRAL, 0.3, "Choppy price action - no clear pattern"),
-        }
+        pattern_signal = self.PATTERN_SIGNALS.get(pattern)
+        if pattern_signal is None:
+            pattern_signal = (SignalType.NEUTRAL, 0.5, f"Price action: {pattern}")
 
-        signal_type, confidence, reasoning = pattern_signals.get(
-            pattern, (SignalType.NEUTRAL, 0.5, f"Price action: {pattern}")
-        )
+        signal_type, confidence, reasoning = pattern_signal
 
         return TechnicalSignal(
             indicator="price_action",
@@ -350,9 +386,10 @@ class TechnicalAnalyzer:
         bearish_score = 0.0
 
         for signal in signals:
-            if signal.signal == SignalType.BULLISH:
+            tag = signal.signal_tag
+            if tag == _BULLISH_TAG:
                 bullish_score += signal.confidence
-            elif signal.signal == SignalType.BEARISH:
+            elif tag == _BEARISH_TAG:
                 bearish_score += signal.confidence
 
         # If no directional signals, return neutral
@@ -226,40 +226,88 @@ class Broker:
                     logger.warning(f"No quote data for {symbol}")
                     return None
 
-                quote = quotes[symbol]
-                return {
-                    "symbol": symbol,
-                    "bid": float(quote.bid_price),
-                    "ask": float(quote.ask_price),
-                }
+                return self._parse_crypto_quote(symbol, quotes[symbol])
             else:
                 # Stock: use old alpaca-trade-api
-                quote = self.api.get_latest_quote(symbol)
+                return self._parse_stock_quote(symbol, self.api.get_latest_quote(symbol))
 
-                # Handle different quote object formats
-                result = {"symbol": symbol}
+        except Exception as e:
+            logger.error(f"Failed to get quote for {symbol}: {e}")
+            return None
 
-                # Try to get bid/ask prices
-                if hasattr(quote, 'bp'):
-                    result["bid"] = float(quote.bp)
-                elif hasattr(quote, 'bid_price'):
-                    result["bid"] = float(quote.bid_price)
+    @staticmethod
+    def _parse_stock_quote(symbol: str, quote: Any) -> Optional[Dict[str, Any]]:
+        """Build a quote dict from an alpaca-trade-api stock quote, or None without prices."""
+        # Handle different quote object formats
+        result = {"symbol": symbol}
+
+        # Try to get bid/ask prices
+        if hasattr(quote, 'bp'):
+            result["bid"] = float(quote.bp)
+        elif hasattr(quote, 'bid_price'):
+            result["bid"] = float(quote.bid_price)
+
+        if hasattr(quote, 'ap'):
+            result["ask"] = float(quote.ap)
+        elif hasattr(quote, 'ask_price'):
+            result["ask"] = float(quote.ask_price)
+
+        # Use ask price if available, otherwise bid, otherwise None
+        if "ask" not in result and "bid" not in result:
+            logger.warning(f"No price data in quote for {symbol}")
+            return None
 
-                if hasattr(quote, 'ap'):
-                    result["ask"] = float(quote.ap)
-                elif hasattr(quote, 'ask_price'):
-                    result["ask"] = float(quote.ask_price)
+        return result
 
-                # Use ask price if available, otherwise bid, otherwise None
-                if "ask" not in result and "bid" not in result:
-                    logger.warning(f"No price data in quote for {symbol}")
-                    return None
+    @staticmethod
+    def _parse_crypto_quote(symbol: str, quote: Any) -> Optional[Dict[str, Any]]:
+        """Build a quote dict from an alpaca-py crypto quote."""
+        return {
+            "symbol": symbol,
+            "bid": float(quote.bid_price),
+            "ask": float(quote.ask_price),
+        }
 
-                return result
+    def get_latest_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get latest quotes for several symbols with one request per asset class.
 
-        except Exception as e:
-            logger.error(f"Failed to get quote for {symbol}: {e}")
-            return None
+        Uses the same clients as get_latest_quote (alpaca-trade-api for
+        stocks, alpaca-py for crypto), so both return the same quotes.
+
+        Args:
+            symbols: Stock/crypto symbols (e.g., ["TSLA", "IWM", "BTC/USD"])
+
+        Returns:
+            Dict mapping symbol to quote dict with bid and ask; symbols
+            without quote data are omitted
+        """
+        stocks = [s for s in symbols if not self._is_crypto(s)]
+        cryptos = [s for s in symbols if self._is_crypto(s)]
+
+        results = {}
+        for group, fetch, parse in (
+            (stocks, self.api.get_latest_quotes, self._parse_stock_quote),
+            (cryptos, lambda syms: self.crypto_data_client.get_crypto_latest_quote(
+                CryptoLatestQuoteRequest(symbol_or_symbols=syms)), self._parse_crypto_quote),
+        ):
+            if not group:
+                continue
+            try:
+                quotes = fetch(group)
+            except Exception as e:
+                logger.error(f"Failed to get quotes for {', '.join(group)}: {e}")
+                continue
+
+            for symbol in group:
+                quote = quotes.get(symbol)
+                if quote is None:
+                    logger.warning(f"No quote data for {symbol}")
+                    continue
+                parsed = parse(symbol, quote)
+                if parsed is not None:
+                    results[symbol] = parsed
+
+        return results
 
     def _convert_timeframe(self, timeframe_str: str) -> TimeFrame:
         """Convert timeframe string to alpaca-py TimeFrame object."""
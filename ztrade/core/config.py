@@ -1,13 +1,29 @@
 """Configuration loading and management utilities."""
 import os
+import copy
 import json
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from ztrade.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=128)
+def _parse_yaml(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file once per (path, mtime); an edited file gets a new key.
+
+    Superseded (path, old mtime) entries are never hit again, so the cache
+    is bounded to evict them.
+    """
+    with open(path_str, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
 
 class Config:
     """Configuration loader and manager."""
@@ -31,17 +47,18 @@ class Config:
         Returns:
             Parsed YAML as dict
         """
-        path = Path(file_path)
-        if not path.exists():
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except FileNotFoundError:
             logger.warning(f"YAML file not found: {file_path}")
             return {}
 
-        with open(path, 'r') as f:
-            try:
-                return yaml.safe_load(f) or {}
-            except yaml.YAMLError as e:
-                logger.error(f"Error parsing YAML {file_path}: {e}")
-                return {}
+        try:
+            # Callers may modify the result, so hand out a copy of the cached parse
+            return copy.deepcopy(_parse_yaml(str(file_path), mtime_ns))
+        except yaml.YAMLError as e:
+            logger.error(f"Error parsing YAML {file_path}: {e}")
+            return {}
 
     def load_json(self, file_path: str) -> Dict[str, Any]:
         """Load a JSON file.
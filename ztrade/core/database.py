@@ -3,7 +3,7 @@ import os
 import json
 import sqlite3
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -38,6 +38,13 @@ def get_db_connection():
         # Enable foreign keys
         conn.execute("PRAGMA foreign_keys = ON")
 
+        # WAL lets readers (dashboard, backtests) run alongside bulk inserts,
+        # and NORMAL sync only fsyncs at checkpoints, which is safe under WAL
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -65536")  # 64 MiB page cache
+
         # Return rows as dictionaries
         conn.row_factory = sqlite3.Row
 
@@ -109,25 +116,41 @@ class MarketDataStore:
         if not bars:
             return 0
 
+        # Prepare values for bulk insert
+        values = [
+            (
+                bar['symbol'],
+                bar['timestamp'],
+                bar['timeframe'],
+                bar.get('open'),
+                bar.get('high'),
+                bar.get('low'),
+                bar.get('close'),
+                bar.get('volume'),
+                bar.get('vwap'),
+                bar.get('trade_count')
+            )
+            for bar in bars
+        ]
+        return MarketDataStore.insert_bar_rows(values)
+
+    @staticmethod
+    def insert_bar_rows(rows: List[tuple]) -> int:
+        """
+        Insert bars given as row tuples, skipping per-bar dictionaries.
+
+        Args:
+            rows: Tuples of (symbol, timestamp, timeframe, open, high, low,
+                  close, volume, vwap, trade_count)
+
+        Returns:
+            Number of bars inserted
+        """
+        if not rows:
+            return 0
+
         try:
             with get_db_connection() as conn:
-                # Prepare values for bulk insert
-                values = [
-                    (
-                        bar['symbol'],
-                        bar['timestamp'],
-                        bar['timeframe'],
-                        bar.get('open'),
-                        bar.get('high'),
-                        bar.get('low'),
-                        bar.get('close'),
-                        bar.get('volume'),
-                        bar.get('vwap'),
-                        bar.get('trade_count')
-                    )
-                    for bar in bars
-                ]
-
                 # Bulk insert with ON CONFLICT
                 conn.executemany(
                     """
@@ -136,11 +159,11 @@ class MarketDataStore:
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     ON CONFLICT (symbol, timestamp, timeframe) DO NOTHING
                     """,
-                    values
+                    rows
                 )
 
-            logger.info(f"Inserted {len(bars)} bars")
-            return len(bars)
+            logger.info(f"Inserted {len(rows)} bars")
+            return len(rows)
 
         except Exception as e:
             logger.error(f"Error bulk inserting bars: {e}")
@@ -169,6 +192,30 @@ class MarketDataStore:
             logger.error(f"Error fetching bars for {symbol}: {e}")
             return []
 
+    @staticmethod
+    def get_timestamp_range(
+        symbol: str, timeframe: str
+    ) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Get the timestamps of the oldest and newest stored bars for a symbol/timeframe."""
+        try:
+            with get_db_connection() as conn:
+                row = conn.execute("""
+                    SELECT MIN(timestamp) AS earliest, MAX(timestamp) AS latest
+                    FROM market_bars
+                    WHERE symbol = ? AND timeframe = ?
+                """, (symbol, timeframe)).fetchone()
+
+            if row is None or row['latest'] is None:
+                return None, None
+            return tuple(
+                value if isinstance(value, datetime) else datetime.fromisoformat(value)
+                for value in (row['earliest'], row['latest'])
+            )
+
+        except Exception as e:
+            logger.error(f"Error fetching stored bar range for {symbol}: {e}")
+            return None, None
+
 
 class SentimentDataStore:
     """Store for historical sentiment data."""
@@ -0,0 +1,41 @@
+"""Token-bucket rate limiting for external APIs."""
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by concurrent workers.
+
+    Holds up to `capacity` tokens, refilled continuously at `rate` tokens per
+    `per` seconds. Each request takes one token, so bursts up to capacity go
+    out immediately and sustained traffic is paced at the refill rate.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Requests allowed per `per` seconds
+            per: Length of the rate window in seconds
+            capacity: Maximum burst size (default: rate)
+        """
+        self.rate = rate / per
+        self.capacity = float(rate if capacity is None else capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            # Sleep outside the lock so other workers can refill and check too
+            time.sleep(wait)
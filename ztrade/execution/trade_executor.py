@@ -1,14 +1,54 @@
 """Trade execution and state management."""
 import json
+import math
+import numbers
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import BinaryIO, Dict, Any, Optional
 from ztrade.core.config import get_config
 from ztrade.broker import get_broker
 from ztrade.core.logger import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
+TRADE_LOG_DIR = Path('logs/trades')
+DECISION_LOG_DIR = Path('logs/agent_decisions')
+
+
+def _json_default(value: Any) -> Any:
+    """Convert numpy values (e.g. indicator outputs) to Python types for JSON."""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Return True if a record contains NaN or infinity anywhere."""
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    if hasattr(value, 'tolist'):
+        return _has_non_finite(value.tolist())
+    return isinstance(value, numbers.Real) and not math.isfinite(value)
+
+
+def _dump_log_line(record: Dict[str, Any]) -> bytes:
+    """Serialize a log record as one JSONL line, using orjson when available."""
+    # orjson writes NaN/Infinity as null, so those records keep json's output
+    if orjson is not None and not _has_non_finite(record):
+        return orjson.dumps(
+            record,
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE,
+        )
+    return (json.dumps(record, default=_json_default) + '\n').encode()
+
 
 class TradeExecutor:
     """Handles trade execution, logging, and state updates."""
@@ -17,6 +57,54 @@ class TradeExecutor:
         self.config = get_config()
         self.broker = get_broker()
 
+        # Log paths for the current day, rebuilt only when the date changes
+        self._log_day = ''
+        self._trade_log_path: Optional[Path] = None
+        self._decision_log_paths: Dict[str, Path] = {}
+
+        # Log files kept open across trades with a large write buffer, so a
+        # record costs a buffered write; flushed once per execute_trade
+        self._log_handles: Dict[Path, BinaryIO] = {}
+
+    def flush(self):
+        """Flush buffered trade and decision log records to disk."""
+        for log_file, handle in self._log_handles.items():
+            try:
+                handle.flush()
+            except OSError as e:
+                # A full disk must not fail the trade that was just placed
+                logger.error("Could not flush log file %s: %s", log_file, e)
+
+    def close(self):
+        """Flush and close all open log files."""
+        self.flush()
+        for handle in self._log_handles.values():
+            try:
+                handle.close()
+            except OSError:
+                pass  # Already reported by flush()
+        self._log_handles.clear()
+
+    def _append_log(self, log_file: Path, record: Dict[str, Any]):
+        """Append a JSONL record to a log file, opening it on first use."""
+        try:
+            handle = self._log_handles.get(log_file)
+            if handle is None:
+                log_file.parent.mkdir(parents=True, exist_ok=True)
+                handle = open(log_file, 'ab', buffering=1 << 16)
+                self._log_handles[log_file] = handle
+            handle.write(_dump_log_line(record))
+        except OSError as e:
+            logger.error("Could not write to log file %s: %s", log_file, e)
+
+    def _rotate_log_paths(self, today: str):
+        """Switch cached log paths to a new day and close the previous day's files."""
+        if self._log_day:
+            self.close()
+        self._log_day = today
+        self._trade_log_path = TRADE_LOG_DIR / f'{today}.jsonl'
+        self._decision_log_paths.clear()
+
     def execute_trade(self, agent_id: str, decision: Dict[str, Any], current_price: float, dry_run: bool = False) -> Dict[str, Any]:
         """
         Execute a validated trade decision.
@@ -30,15 +118,29 @@ class TradeExecutor:
         Returns:
             Trade result dictionary
         """
+        try:
+            return self._execute_trade(agent_id, decision, current_price, dry_run)
+        finally:
+            # Records are on disk before the caller continues; Airflow tasks
+            # leave via os._exit, which skips buffered file flushes
+            self.flush()
+
+    def _execute_trade(
+        self, agent_id: str, decision: Dict[str, Any], current_price: float, dry_run: bool
+    ) -> Dict[str, Any]:
+        """Execute a trade and log it (execute_trade flushes the logs afterwards)."""
         action = decision.get('action', '').lower()
         agent_config = self.config.load_agent_config(agent_id)
         asset = agent_config.get('agent', {}).get('asset', 'UNKNOWN')
 
+        # Single timestamp shared by the result, state update and log records
+        timestamp = datetime.now().isoformat()
+
         result = {
             'agent_id': agent_id,
             'asset': asset,
             'action': action,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'dry_run': dry_run,
             'success': False,
         }
@@ -47,7 +149,7 @@ class TradeExecutor:
         if action == 'hold':
             result['success'] = True
             result['message'] = 'Holding position'
-            self._log_decision(agent_id, decision, result)
+            self._log_decision(agent_id, decision, result, timestamp)
             return result
 
         elif action in ['buy', 'sell']:
@@ -59,7 +161,7 @@ class TradeExecutor:
                 result['message'] = f'DRY RUN: Would {action} {quantity} shares of {asset} at ${current_price:.2f}'
                 if stop_loss:
                     result['message'] += f' with stop loss at ${stop_loss:.2f}'
-                self._log_decision(agent_id, decision, result)
+                self._log_decision(agent_id, decision, result, timestamp)
                 return result
 
             # Execute actual trade
@@ -79,27 +181,31 @@ class TradeExecutor:
                 result['message'] = f'{action.upper()} order submitted: {quantity} shares of {asset}'
 
                 # Update agent state
-                self._update_agent_state(agent_id, decision, order_result)
+                self._update_agent_state(agent_id, decision, order_result, timestamp)
 
                 # Log trade
-                self._log_trade(agent_id, decision, order_result)
+                self._log_trade(agent_id, decision, order_result, timestamp)
 
             except Exception as e:
                 result['success'] = False
                 result['error'] = str(e)
                 result['message'] = f'Trade execution failed: {e}'
-                logger.error(f"Trade execution failed for {agent_id}: {e}")
+                logger.error("Trade execution failed for %s: %s", agent_id, e)
 
-            self._log_decision(agent_id, decision, result)
+            self._log_decision(agent_id, decision, result, timestamp)
             return result
 
         else:
             result['message'] = f'Unknown action: {action}'
-            self._log_decision(agent_id, decision, result)
+            self._log_decision(agent_id, decision, result, timestamp)
             return result
 
-    def _update_agent_state(self, agent_id: str, decision: Dict[str, Any], order_result: Dict[str, Any]):
+    def _update_agent_state(
+        self, agent_id: str, decision: Dict[str, Any], order_result: Dict[str, Any], timestamp: str
+    ):
         """Update agent state after trade execution."""
+        # Read-modify-write against disk: risk checks in other processes read
+        # state.json, so it must reflect this trade before we return
         agent_state = self.config.load_agent_state(agent_id)
 
         # Increment trade count
@@ -110,14 +216,14 @@ class TradeExecutor:
         quantity = decision.get('quantity', 0)
         filled_price = order_result.get('filled_avg_price', 0)
 
-        positions = agent_state.get('positions', [])
+        positions = agent_state.setdefault('positions', [])
 
         if action == 'buy':
             positions.append({
                 'quantity': quantity,
                 'entry_price': filled_price,
                 'stop_loss': decision.get('stop_loss'),
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'order_id': order_result.get('id')
             })
         elif action == 'sell':
@@ -126,48 +232,53 @@ class TradeExecutor:
             if positions:
                 positions.pop(0)
 
-        agent_state['positions'] = positions
-        agent_state['last_trade_time'] = datetime.now().isoformat()
+        agent_state['last_trade_time'] = timestamp
 
         # Save updated state
         self.config.save_agent_state(agent_id, agent_state)
 
-    def _log_trade(self, agent_id: str, decision: Dict[str, Any], order_result: Dict[str, Any]):
+    def _log_trade(
+        self, agent_id: str, decision: Dict[str, Any], order_result: Dict[str, Any], timestamp: str
+    ):
         """Log trade execution to trades log."""
-        log_dir = Path('logs/trades')
-        log_dir.mkdir(parents=True, exist_ok=True)
-
-        today = datetime.now().strftime('%Y-%m-%d')
-        log_file = log_dir / f'{today}.jsonl'
+        today = timestamp[:10]  # ISO timestamp starts with YYYY-MM-DD
+        if today != self._log_day:
+            self._rotate_log_paths(today)
+        log_file = self._trade_log_path
 
         trade_log = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'agent_id': agent_id,
             'decision': decision,
             'order_result': order_result,
         }
 
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(trade_log) + '\n')
+        self._append_log(log_file, trade_log)
 
-        logger.info(f"Trade logged for {agent_id}: {decision.get('action')} {decision.get('quantity', 0)} shares")
+        logger.info(
+            "Trade logged for %s: %s %s shares",
+            agent_id, decision.get('action'), decision.get('quantity', 0)
+        )
 
-    def _log_decision(self, agent_id: str, decision: Dict[str, Any], result: Dict[str, Any]):
+    def _log_decision(
+        self, agent_id: str, decision: Dict[str, Any], result: Dict[str, Any], timestamp: str
+    ):
         """Log agent decision to decisions log."""
-        log_dir = Path('logs/agent_decisions')
-        log_dir.mkdir(parents=True, exist_ok=True)
-
-        today = datetime.now().strftime('%Y-%m-%d')
-        log_file = log_dir / f'{agent_id}_{today}.jsonl'
+        today = timestamp[:10]  # ISO timestamp starts with YYYY-MM-DD
+        if today != self._log_day:
+            self._rotate_log_paths(today)
+        log_file = self._decision_log_paths.get(agent_id)
+        if log_file is None:
+            log_file = DECISION_LOG_DIR / f'{agent_id}_{today}.jsonl'
+            self._decision_log_paths[agent_id] = log_file
 
         decision_log = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'agent_id': agent_id,
             'decision': decision,
             'result': result,
         }
 
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(decision_log) + '\n')
+        self._append_log(log_file, decision_log)
 
-        logger.info(f"Decision logged for {agent_id}: {decision.get('action')}")
+        logger.info("Decision logged for %s: %s", agent_id, decision.get('action'))
@@ -121,11 +121,14 @@ class MarketDataProvider:
                     "newest_timestamp": bars[-1]["timestamp"],
                 }
 
+                # Close series shared by the indicator and trend passes
+                closes = [bar["close"] for bar in bars]
+
                 # Calculate technical indicators
-                context["technical_indicators"] = self._calculate_indicators(bars)
+                context["technical_indicators"] = self._calculate_indicators(bars, closes)
 
                 # Analyze trend
-                context["trend_analysis"] = self._analyze_trend(bars)
+                context["trend_analysis"] = self._analyze_trend(bars, closes)
 
                 # Find support/resistance
                 context["levels"] = self._find_support_resistance(bars)
@@ -235,12 +238,15 @@ class MarketDataProvider:
             logger.error(f"Error fetching historical bars for {symbol}: {e}")
             return []
 
-    def _calculate_indicators(self, bars: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate technical indicators from price bars."""
+    def _calculate_indicators(
+        self, bars: List[Dict[str, Any]], closes: Optional[List[float]] = None
+    ) -> Dict[str, Any]:
+        """Calculate technical indicators from price bars (or their precomputed closes)."""
         if not bars or len(bars) < 20:
             return {"insufficient_data": True}
 
-        closes = [bar["close"] for bar in bars]
+        if closes is None:
+            closes = [bar["close"] for bar in bars]
 
         indicators = {}
 
@@ -269,13 +275,20 @@ class MarketDataProvider:
         if len(prices) < period + 1:
             return 50.0  # Neutral
 
-        deltas = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
-
-        gains = [d if d > 0 else 0 for d in deltas[-period:]]
-        losses = [-d if d < 0 else 0 for d in deltas[-period:]]
+        # Only the last `period` deltas are averaged, so skip differencing the
+        # rest of the series
+        window = prices[-(period + 1):]
+        gains = 0.0
+        losses = 0.0
+        for prev, curr in zip(window, window[1:]):
+            delta = curr - prev
+            if delta > 0:
+                gains += delta
+            else:
+                losses -= delta
 
-        avg_gain = sum(gains) / period
-        avg_loss = sum(losses) / period
+        avg_gain = gains / period
+        avg_loss = losses / period
 
         if avg_loss == 0:
             return 100.0
@@ -285,15 +298,18 @@ class MarketDataProvider:
 
         return round(rsi, 2)
 
-    def _analyze_trend(self, bars: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_trend(
+        self, bars: List[Dict[str, Any]], closes: Optional[List[float]] = None
+    ) -> Dict[str, Any]:
         """Analyze price trend."""
         if len(bars) < 10:
             return {"trend": "unknown", "strength": 0}
 
-        closes = [bar["close"] for bar in bars]
-
         # Simple trend detection
-        recent_closes = closes[-10:]
+        if closes is None:
+            recent_closes = [bar["close"] for bar in bars[-10:]]
+        else:
+            recent_closes = closes[-10:]
         first_half_avg = sum(recent_closes[:5]) / 5
         second_half_avg = sum(recent_closes[5:]) / 5
 
@@ -1,13 +1,30 @@
 """Multi-source sentiment aggregator for trading decisions."""
 
-from typing import Dict, Any, Optional
+import copy
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
 from ztrade.sentiment.news import get_news_analyzer
 from ztrade.sentiment.reddit import get_reddit_analyzer
 from ztrade.sentiment.sec import get_sec_analyzer
 from ztrade.core.logger import get_logger
 
+try:
+    import redis
+except ImportError:
+    redis = None
+
 logger = get_logger(__name__)
 
+# Process-local fallback cache when Redis isn't configured: key -> (expires_at, result)
+_local_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_local_cache_lock = threading.Lock()
+
+# Upper bound on _local_cache entries; the oldest are evicted first
+LOCAL_CACHE_MAX_ENTRIES = 256
+
 
 class SentimentAggregator:
     """Aggregates sentiment from multiple sources with weighted scoring."""
@@ -20,12 +37,16 @@ class SentimentAggregator:
         "stocktwits": 0.10  # Reserved for future use
     }
 
+    # Aggregated results are reused within the same clock hour for this long
+    CACHE_TTL_SECONDS = 3600
+
     def __init__(
         self,
         weights: Optional[Dict[str, float]] = None,
         enable_news: bool = True,
         enable_reddit: bool = True,
-        enable_sec: bool = True
+        enable_sec: bool = True,
+        use_cache: bool = False
     ):
         """
         Initialize sentiment aggregator.
@@ -35,11 +56,23 @@ class SentimentAggregator:
             enable_news: Enable news sentiment analysis
             enable_reddit: Enable Reddit sentiment analysis
             enable_sec: Enable SEC filings analysis
+            use_cache: Reuse results for the same symbol/lookbacks within the hour
+                (shared through Redis when REDIS_URL is set, else per process).
+                Off by default so trading decisions always see fresh sentiment.
         """
         self.weights = weights or self.DEFAULT_WEIGHTS.copy()
         self.enable_news = enable_news
         self.enable_reddit = enable_reddit
         self.enable_sec = enable_sec
+        self.use_cache = use_cache
+        self._redis = self._connect_cache() if use_cache else None
+
+        # Results depend on which sources are enabled and how they're weighted
+        enabled = "".join(
+            flag for flag, on in (("n", enable_news), ("r", enable_reddit), ("s", enable_sec)) if on
+        )
+        weights_key = ",".join(f"{src}={w:g}" for src, w in sorted(self.weights.items()))
+        self._cache_prefix = f"sentiment:{enabled}:{weights_key}"
 
         # Initialize analyzers
         self.news_analyzer = get_news_analyzer() if enable_news else None
@@ -53,6 +86,62 @@ class SentimentAggregator:
             f"sec={self.weights['sec']:.0%}"
         )
 
+    @staticmethod
+    def _connect_cache():
+        """Connect to Redis from REDIS_URL, or return None to use the local cache."""
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url or redis is None:
+            return None
+
+        try:
+            client = redis.Redis.from_url(redis_url, socket_timeout=1)
+            client.ping()
+            return client
+        except Exception as e:
+            logger.warning(f"Redis sentiment cache unavailable ({e}), using in-process cache")
+            return None
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached aggregate for key, if still fresh."""
+        if self._redis is not None:
+            try:
+                cached = self._redis.get(key)
+                return json.loads(cached) if cached else None
+            except Exception as e:
+                logger.debug(f"Redis cache read failed: {e}")
+                return None
+
+        with _local_cache_lock:
+            entry = _local_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at < time.time():
+                _local_cache.pop(key, None)
+                return None
+        # Callers may mutate the result; keep the cached copy intact
+        return copy.deepcopy(result)
+
+    def _cache_set(self, key: str, result: Dict[str, Any]):
+        """Store an aggregate for CACHE_TTL_SECONDS."""
+        if self._redis is not None:
+            try:
+                self._redis.set(key, json.dumps(result, default=str), ex=self.CACHE_TTL_SECONDS)
+            except Exception as e:
+                logger.debug(f"Redis cache write failed: {e}")
+            return
+
+        entry = (time.time() + self.CACHE_TTL_SECONDS, copy.deepcopy(result))
+        with _local_cache_lock:
+            now = time.time()
+            # Hour-bucketed keys are never read again once expired; drop them here
+            # so a long-running process doesn't accumulate one entry per hour
+            for stale in [k for k, (expires_at, _) in _local_cache.items() if expires_at < now]:
+                _local_cache.pop(stale, None)
+            while len(_local_cache) >= LOCAL_CACHE_MAX_ENTRIES:
+                _local_cache.pop(next(iter(_local_cache)), None)
+            _local_cache[key] = entry
+
     def get_aggregated_sentiment(
         self,
         symbol: str,
@@ -78,6 +167,18 @@ class SentimentAggregator:
             - sources_used: List of sources that contributed data
             - agreement_level: How much sources agree (0 to 1)
         """
+        cache_key = None
+        if self.use_cache:
+            hour_bucket = int(time.time() // 3600)
+            cache_key = (
+                f"{self._cache_prefix}:{symbol}:"
+                f"{news_lookback_hours}:{reddit_lookback_hours}:{sec_lookback_days}:{hour_bucket}"
+            )
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached aggregated sentiment for {symbol}")
+                return cached
+
         logger.info(f"Aggregating sentiment for {symbol} from all sources...")
 
         # Collect sentiment from each source
@@ -223,6 +324,9 @@ class SentimentAggregator:
             f"sources: {len(sources_used)}, agreement: {agreement_level:.0%})"
         )
 
+        if cache_key is not None:
+            self._cache_set(cache_key, result)
+
         return result
 
 
@@ -230,7 +334,8 @@ def get_sentiment_aggregator(
     weights: Optional[Dict[str, float]] = None,
     enable_news: bool = True,
     enable_reddit: bool = True,
-    enable_sec: bool = True
+    enable_sec: bool = True,
+    use_cache: bool = False
 ) -> SentimentAggregator:
     """
     Factory function to get sentiment aggregator instance.
@@ -240,6 +345,7 @@ def get_sentiment_aggregator(
         enable_news: Enable news sentiment
         enable_reddit: Enable Reddit sentiment
         enable_sec: Enable SEC sentiment
+        use_cache: Reuse aggregated results within the hour (default off)
 
     Returns:
         SentimentAggregator instance
@@ -248,5 +354,6 @@ def get_sentiment_aggregator(
         weights=weights,
         enable_news=enable_news,
         enable_reddit=enable_reddit,
-        enable_sec=enable_sec
+        enable_sec=enable_sec,
+        use_cache=use_cache
     )
@@ -1,13 +1,40 @@
 """Reddit sentiment analysis for trading symbols."""
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
+from operator import itemgetter
 import os
+import numpy as np
 from dotenv import load_dotenv
 from ztrade.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Fields copied from each post mention into the top_posts summary
+_TOP_POST_FIELDS = itemgetter("title", "score", "upvote_ratio", "num_comments", "subreddit")
+
+# Column order of the per-mention sentiment matrix
+_SENTIMENT_COLUMNS = ("compound", "pos", "neg", "neu")
+
+
+def _aggregate_sentiments(sentiments: np.ndarray) -> Tuple[float, float, float, float, int, int]:
+    """
+    Aggregate FinBERT scores over a sentiment matrix.
+
+    Args:
+        sentiments: Non-empty float32 array of shape (N, 4), columns ordered
+            as compound/pos/neg/neu
+
+    Returns:
+        Tuple of (avg_compound, avg_pos, avg_neg, avg_neu, positive_count, negative_count)
+    """
+    avg_compound, avg_pos, avg_neg, avg_neu = sentiments.mean(axis=0, dtype=np.float64).tolist()
+    compound = sentiments[:, 0]
+    positive_count = int(np.count_nonzero(compound > 0.05))
+    negative_count = int(np.count_nonzero(compound < -0.05))
+
+    return avg_compound, avg_pos, avg_neg, avg_neu, positive_count, negative_count
+
 
 class RedditAnalyzer:
     """Analyzes Reddit sentiment for trading symbols."""
@@ -123,8 +150,10 @@ class RedditAnalyzer:
             cutoff_time = datetime.utcnow() - timedelta(hours=lookback_hours)
             cutoff_timestamp = cutoff_time.timestamp()
 
-            # Collect mentions across subreddits
+            # Collect mentions across subreddits. Metadata and sentiment scores are
+            # kept in parallel lists; scores become a float32 matrix for aggregation.
             all_mentions = []
+            sentiment_rows = []
             post_count = 0
             comment_count = 0
 
@@ -132,22 +161,44 @@ class RedditAnalyzer:
                 try:
                     subreddit = self.reddit.subreddit(subreddit_name)
 
-                    # Search for posts mentioning the symbol
-                    for post in subreddit.search(
+                    # Search for posts mentioning the symbol. The listing
+                    # stops fetching pages once `limit` posts have been yielded.
+                    listing = subreddit.search(
                         f"${symbol} OR {symbol}",
                         time_filter="day",
                         limit=max_posts
-                    ):
+                    )
+                    for post in listing:
                         # Check if post is within time window
                         if post.created_utc < cutoff_timestamp:
                             continue
 
                         post_count += 1
 
-                        # Analyze post title and body
+                        # Gather top comments (first 10) so the whole thread is
+                        # scored in a single FinBERT pass instead of one per comment
+                        comment_texts = []
+                        try:
+                            post.comments.replace_more(limit=0)  # Don't expand "load more comments"
+                            for comment in post.comments[:10]:
+                                if not hasattr(comment, 'body'):
+                                    continue
+
+                                comment_text = comment.body.strip()
+                                if comment_text and len(comment_text) > 10:
+                                    comment_texts.append(comment_text[:200])
+                        except Exception as e:
+                            logger.debug(f"Could not fetch comments for post: {e}")
+
+                        comment_count += len(comment_texts)
+
+                        # Analyze title, body and comments as one post context
                         text = f"{post.title} {post.selftext}".strip()
-                        if text and len(text) > 10:
-                            scores = self.sentiment_analyzer.polarity_scores(text)
+                        combined_text = "\n".join(
+                            [post.title, post.selftext[:800], *comment_texts]
+                        ).strip()[:1500]
+                        if combined_text and len(combined_text) > 10:
+                            scores = self.sentiment_analyzer.polarity_scores(combined_text)
                             all_mentions.append({
                                 "type": "post",
                                 "subreddit": subreddit_name,
@@ -156,33 +207,13 @@ class RedditAnalyzer:
                                 "score": post.score,
                                 "upvote_ratio": post.upvote_ratio,
                                 "num_comments": post.num_comments,
-                                "sentiment": scores,
+                                "comments_scored": len(comment_texts),
                                 "created_utc": post.created_utc,
                                 "url": post.url
                             })
-
-                        # Analyze top comments (first 10)
-                        try:
-                            post.comments.replace_more(limit=0)  # Don't expand "load more comments"
-                            for comment in post.comments[:10]:
-                                if not hasattr(comment, 'body'):
-                                    continue
-
-                                comment_text = comment.body.strip()
-                                if comment_text and len(comment_text) > 10:
-                                    comment_count += 1
-                                    scores = self.sentiment_analyzer.polarity_scores(comment_text)
-                                    all_mentions.append({
-                                        "type": "comment",
-                                        "subreddit": subreddit_name,
-                                        "text": comment_text[:500],
-                                        "score": comment.score,
-                                        "sentiment": scores,
-                                        "created_utc": comment.created_utc
-                                    })
-                        except Exception as e:
-                            logger.debug(f"Could not fetch comments for post: {e}")
-                            continue
+                            sentiment_rows.append(
+                                tuple(scores[column] for column in _SENTIMENT_COLUMNS)
+                            )
 
                 except Exception as e:
                     logger.warning(f"Error searching subreddit {subreddit_name}: {e}")
@@ -202,11 +233,11 @@ class RedditAnalyzer:
                 }
 
             # Aggregate sentiment scores
-            sentiments = [m["sentiment"] for m in all_mentions]
-            avg_compound = sum(s["compound"] for s in sentiments) / len(sentiments)
-            avg_pos = sum(s["pos"] for s in sentiments) / len(sentiments)
-            avg_neg = sum(s["neg"] for s in sentiments) / len(sentiments)
-            avg_neu = sum(s["neu"] for s in sentiments) / len(sentiments)
+            sentiments = np.array(sentiment_rows, dtype=np.float32)
+            (
+                avg_compound, avg_pos, avg_neg, avg_neu,
+                positive_count, negative_count
+            ) = _aggregate_sentiments(sentiments)
 
             # Determine overall sentiment
             if avg_compound >= 0.05:
@@ -217,36 +248,41 @@ class RedditAnalyzer:
                 overall = "neutral"
 
             # Calculate confidence based on consistency
-            positive_count = sum(1 for s in sentiments if s["compound"] > 0.05)
-            negative_count = sum(1 for s in sentiments if s["compound"] < -0.05)
             neutral_count = len(sentiments) - positive_count - negative_count
 
             max_agreement = max(positive_count, negative_count, neutral_count)
             confidence = max_agreement / len(sentiments) if len(sentiments) > 0 else 0
 
-            # Calculate trending score (mentions per hour)
-            trending_score = len(all_mentions) / lookback_hours if lookback_hours > 0 else 0
+            # Calculate trending score (mentions per hour). Comments are folded
+            # into their post's score but still count as mentions.
+            mention_count = len(all_mentions) + comment_count
+            trending_score = mention_count / lookback_hours if lookback_hours > 0 else 0
 
             # Get top posts by score
-            posts_only = [m for m in all_mentions if m["type"] == "post"]
-            top_posts = sorted(posts_only, key=lambda x: x.get("score", 0), reverse=True)[:5]
+            top_indices = sorted(
+                range(len(all_mentions)),
+                key=lambda i: all_mentions[i].get("score", 0),
+                reverse=True
+            )[:5]
             top_post_titles = [
                 {
-                    "title": p["title"],
-                    "score": p["score"],
-                    "upvote_ratio": p.get("upvote_ratio", 0),
-                    "num_comments": p.get("num_comments", 0),
-                    "subreddit": p["subreddit"],
-                    "sentiment": p["sentiment"]["compound"]
+                    "title": title,
+                    "score": score,
+                    "upvote_ratio": upvote_ratio,
+                    "num_comments": num_comments,
+                    "subreddit": post_subreddit,
+                    "sentiment": round(float(sentiments[i, 0]), 4)
                 }
-                for p in top_posts
+                for i in top_indices
+                for title, score, upvote_ratio, num_comments, post_subreddit
+                in (_TOP_POST_FIELDS(all_mentions[i]),)
             ]
 
             result = {
                 "overall_sentiment": overall,
                 "sentiment_score": round(avg_compound, 3),
                 "confidence": round(confidence, 2),
-                "mention_count": len(all_mentions),
+                "mention_count": mention_count,
                 "post_count": post_count,
                 "comment_count": comment_count,
                 "trending_score": round(trending_score, 2),
@@ -265,7 +301,7 @@ class RedditAnalyzer:
             logger.info(
                 f"Reddit sentiment for {symbol}: {overall} "
                 f"(score: {avg_compound:.2f}, confidence: {confidence:.2f}, "
-                f"mentions: {len(all_mentions)}, posts: {post_count}, "
+                f"mentions: {mention_count}, posts: {post_count}, "
                 f"comments: {comment_count}, trending: {trending_score:.2f}/hr)"
             )
 
@@ -1,14 +1,39 @@
 """SEC EDGAR filings analysis for trading symbols."""
 
-from typing import Dict, Any, List, Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from bisect import bisect_left
 from datetime import datetime, timedelta
+from pathlib import Path
+import json
+import os
+import re
+import tempfile
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+import threading
 import time
 from ztrade.core.logger import get_logger
+from ztrade.core.rate_limit import TokenBucket
 
 logger = get_logger(__name__)
 
 
+class Filing(NamedTuple):
+    """A single SEC filing from a company's submissions history."""
+    form: str  # e.g., "8-K", "10-Q"
+    filing_date: str  # ISO date, e.g., "2025-01-31"
+    accession_number: str
+    primary_document: str
+    description: str  # Human-readable filing type
+
+
+def _keyword_pattern(keywords, inflections: Dict[str, str]) -> "re.Pattern[str]":
+    """Compile a whole-word, case-insensitive alternation with one group per keyword."""
+    alternatives = (f"({re.escape(kw)}{inflections.get(kw, '')})" for kw in keywords)
+    return re.compile(r"\b(?:" + "|".join(alternatives) + r")\b", re.IGNORECASE)
+
+
 class SECAnalyzer:
     """Analyzes SEC EDGAR filings for trading symbols."""
 
@@ -34,6 +59,17 @@ class SECAnalyzer:
         "DEF 14A": "Proxy Statement"
     }
 
+    # Base sentiment by filing type (other forms default to neutral)
+    BASE_SENTIMENT = {
+        "8-K": 0.0,      # Material events - neutral unless keywords say otherwise
+        "10-Q": 0.1,     # Earnings reports - slightly positive (company is operational)
+        "10-K": 0.1,
+        "4": 0.0,        # Insider trading - context-dependent, default neutral
+        "SC 13G": 0.2,   # Large ownership changes - slightly positive (institutional interest)
+        "SC 13D": 0.2,
+        "S-1": 0.3,      # IPO registration - positive
+    }
+
     # Keywords for sentiment detection in filing descriptions
     POSITIVE_KEYWORDS = [
         "beat", "exceed", "growth", "record", "strong", "increase", "positive",
@@ -47,20 +83,95 @@ class SECAnalyzer:
         "restatement", "concern", "warning", "guidance lower", "downgrade"
     ]
 
+    # Inflected forms each keyword also matches, spelled out so e.g. "miss"
+    # matches "missed" but not "missing" or "mission"
+    KEYWORD_INFLECTIONS = {
+        "beat": "(?:s|ing)?", "exceed": "(?:s|ed|ing)?", "record": "(?:s|ed)?",
+        "strong": "(?:er|est)?", "increase": "(?:s|d)?", "improvement": "s?",
+        "acquisition": "s?", "expansion": "s?", "dividend": "s?", "buyback": "s?",
+        "outperform": "(?:s|ed|ing)?", "guidance raise": "d?", "upgrade": "(?:s|d)?",
+        "miss": "(?:es|ed)?", "decline": "(?:s|d)?", "weak": "(?:er|ness)?",
+        "decrease": "(?:s|d)?", "loss": "(?:es)?", "impairment": "s?", "layoff": "s?",
+        "investigation": "s?", "lawsuit": "s?", "restatement": "s?", "concern": "s?",
+        "warning": "s?", "guidance lower": "(?:ed)?", "downgrade": "(?:s|d)?",
+    }
+
+    # Net weight per keyword and a single case-insensitive alternation over all
+    # of them, so a description is scanned once instead of once per keyword.
+    # Each keyword is its own group (see KEYWORD_GROUPS), so an inflected match
+    # still counts as its keyword. Matches are whole words.
+    KEYWORD_WEIGHTS = {**dict.fromkeys(POSITIVE_KEYWORDS, 1), **dict.fromkeys(NEGATIVE_KEYWORDS, -1)}
+    KEYWORD_GROUPS = tuple(sorted(KEYWORD_WEIGHTS, key=len, reverse=True))
+    KEYWORD_PATTERN = _keyword_pattern(KEYWORD_GROUPS, KEYWORD_INFLECTIONS)
+
+    # Rate limiting: SEC requests max 10 requests per second
+    RATE_LIMIT_PER_SECOND = 10
+
+    # Token bucket shared by all instances and worker threads so concurrent
+    # lookups stay under the SEC cap as a whole. Requests only wait once the
+    # bucket is empty.
+    _rate_limiter = TokenBucket(RATE_LIMIT_PER_SECOND)
+
+    # On-disk response cache under the project root (like data/ztrade.db), so
+    # it doesn't depend on the working directory. Entries younger than their
+    # max age are served without a request; older ones are revalidated with
+    # ETag/Last-Modified.
+    CACHE_DIR = Path(__file__).parent.parent.parent / "cache" / "sec"
+    SUBMISSIONS_MAX_AGE = 3600      # 1 hour
+    TICKERS_MAX_AGE = 86400         # 24 hours
+
+    # Filing dates are ISO "YYYY-MM-DD" strings
+    FILING_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+    # Columns of filings.recent read from submissions (Filing field order)
+    SUBMISSION_COLUMNS = ("form", "filingDate", "accessionNumber", "primaryDocument")
+
+    # Parsed cache files keyed by path, invalidated by file mtime
+    _json_memo: Dict[str, Any] = {}
+
+    # One lock per URL so concurrent cache misses for the same document issue
+    # a single request instead of racing to fetch and write it
+    _url_locks: Dict[str, threading.Lock] = {}
+    _url_locks_guard = threading.Lock()
+
+    # Ticker -> padded CIK index built from the parsed company_tickers.json
+    _ticker_index: Dict[str, str] = {}
+    _ticker_index_source: Any = None
+
+    # Cache symbol -> CIK mappings (pre-populated with common stocks)
+    # CIK format: 10-digit zero-padded number. Shared by all instances since
+    # the mapping only ever grows.
+    cik_cache = {
+        "TSLA": "0000789019",    # Tesla
+        "AAPL": "0000320193",    # Apple
+        "MSFT": "0000789019",    # Microsoft (need correct CIK)
+        "GOOGL": "0001652044",   # Alphabet
+        "GOOG": "0001652044",    # Alphabet
+        "AMZN": "0001018724",    # Amazon
+        "NVDA": "0001045810",    # NVIDIA
+        "META": "0001326801",    # Meta
+    }
+
     def __init__(self):
         """Initialize the SEC analyzer."""
-        # Cache symbol -> CIK mappings (pre-populated with common stocks)
-        # CIK format: 10-digit zero-padded number
-        self.cik_cache = {
-            "TSLA": "0000789019",    # Tesla
-            "AAPL": "0000320193",    # Apple
-            "MSFT": "0000789019",    # Microsoft (need correct CIK)
-            "GOOGL": "0001652044",   # Alphabet
-            "GOOG": "0001652044",    # Alphabet
-            "AMZN": "0001018724",    # Amazon
-            "NVDA": "0001045810",    # NVIDIA
-            "META": "0001326801",    # Meta
-        }
+        # Keep-alive session so repeated requests to data.sec.gov reuse pooled
+        # connections instead of a new TCP+TLS handshake per call. The analyzer
+        # is a shared singleton, so the pool also serves concurrent callers
+        # such as the dashboard's sentiment workers.
+        self.session = requests.Session()
+        self.session.headers.update(self.HEADERS)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=10)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        """Close pooled HTTP connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def get_sec_sentiment(
         self,
@@ -121,10 +232,10 @@ class SECAnalyzer:
                 filing_sentiments.append(sentiment)
 
                 # Track material events (8-K filings)
-                if filing.get("form") == "8-K":
+                if filing.form == "8-K":
                     material_events.append({
-                        "date": filing.get("filingDate"),
-                        "description": filing.get("description", "Material Event"),
+                        "date": filing.filing_date,
+                        "description": filing.description,
                         "sentiment": sentiment
                     })
 
@@ -147,14 +258,15 @@ class SECAnalyzer:
             confidence = min(len(filings) / 10.0, 1.0)
 
             # Format recent filings for output
+            # Reuses the per-filing scores computed above
             recent_filings = [
                 {
-                    "form": f.get("form"),
-                    "filing_date": f.get("filingDate"),
-                    "description": self.FILING_TYPES.get(f.get("form"), f.get("form")),
-                    "sentiment": self._analyze_filing_sentiment(f)
+                    "form": f.form,
+                    "filing_date": f.filing_date,
+                    "description": f.description,
+                    "sentiment": sentiment
                 }
-                for f in filings[:5]  # Top 5 most recent
+                for f, sentiment in zip(filings[:5], filing_sentiments)  # Top 5 most recent
             ]
 
             result = {
@@ -185,6 +297,147 @@ class SECAnalyzer:
                 "filing_count": 0
             }
 
+    def _throttle(self):
+        """Take a token from the shared rate limit bucket, blocking only if it is empty."""
+        SECAnalyzer._rate_limiter.acquire()
+
+    def _get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Issue a rate-limited GET request against the SEC API."""
+        self._throttle()
+        return self.session.get(url, headers=headers, timeout=10)
+
+    def _load_cached_json(self, path: Path) -> Any:
+        """Load a cached response body, reusing the parsed copy while the file is unchanged."""
+        mtime = path.stat().st_mtime_ns
+        memo = SECAnalyzer._json_memo.get(str(path))
+        if memo and memo[0] == mtime:
+            return memo[1]
+
+        data = json.loads(path.read_bytes())
+        SECAnalyzer._json_memo[str(path)] = (mtime, data)
+        return data
+
+    def _get_json(
+        self,
+        url: str,
+        max_age: int,
+        extract: Optional[Callable[[Any], Any]] = None
+    ) -> Optional[Any]:
+        """
+        Fetch a JSON document from the SEC API through the on-disk cache.
+
+        Args:
+            url: SEC API URL
+            max_age: Seconds a cached copy is served without revalidation
+            extract: Optional function that trims a fresh response down to the
+                parts the caller needs; only the trimmed document is cached
+
+        Returns:
+            Parsed JSON, or None if the request failed and nothing is cached
+        """
+        name = url.rsplit("/", 1)[-1]
+        body_path = self.CACHE_DIR / name
+        meta_path = self.CACHE_DIR / f"{name}.meta"
+
+        meta = self._read_cache_meta(body_path, meta_path)
+        if meta and time.time() - meta.get("checked_at", 0) < max_age:
+            return self._load_cached_json(body_path)
+
+        with self._url_lock(url):
+            # Another thread may have refreshed the entry while we waited
+            meta = self._read_cache_meta(body_path, meta_path)
+            if meta and time.time() - meta.get("checked_at", 0) < max_age:
+                return self._load_cached_json(body_path)
+
+            return self._fetch_json(url, body_path, meta_path, meta, extract)
+
+    def _url_lock(self, url: str) -> threading.Lock:
+        """Return the lock serializing cache misses for url."""
+        with SECAnalyzer._url_locks_guard:
+            return SECAnalyzer._url_locks.setdefault(url, threading.Lock())
+
+    @staticmethod
+    def _read_cache_meta(body_path: Path, meta_path: Path) -> Dict[str, Any]:
+        """Read cache validators, or return {} if there is no usable cached copy."""
+        if not (body_path.exists() and meta_path.exists()):
+            return {}
+        try:
+            return json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _fetch_json(
+        self,
+        url: str,
+        body_path: Path,
+        meta_path: Path,
+        meta: Dict[str, Any],
+        extract: Optional[Callable[[Any], Any]]
+    ) -> Optional[Any]:
+        """Fetch or revalidate url and update its cache entry (caller holds the URL lock)."""
+        # Revalidate (or fetch) with conditional headers
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = self._get(url, headers)
+
+        if response.status_code == 304 and meta:
+            meta["checked_at"] = time.time()
+            self._write_cache_meta(meta_path, meta)
+            return self._load_cached_json(body_path)
+
+        if response.status_code != 200:
+            logger.warning(f"SEC API returned status {response.status_code} for {url}")
+            return None
+
+        data = response.json()
+        body = response.content
+        if extract is not None:
+            data = extract(data)
+            body = json.dumps(data).encode()
+
+        try:
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Drop the old validators first: if we stop between the two
+            # writes, the body has no .meta and is refetched rather than
+            # revalidated with an ETag that belongs to a different body
+            meta_path.unlink(missing_ok=True)
+            self._write_atomic(body_path, body)
+            self._write_cache_meta(meta_path, {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "checked_at": time.time()
+            })
+        except OSError as e:
+            logger.warning(f"Could not write SEC cache for {url}: {e}")
+
+        return data
+
+    def _write_cache_meta(self, meta_path: Path, meta: Dict[str, Any]):
+        """Persist cache validators for a cached response."""
+        try:
+            self._write_atomic(meta_path, json.dumps(meta).encode())
+        except OSError as e:
+            logger.warning(f"Could not write SEC cache metadata {meta_path}: {e}")
+
+    @staticmethod
+    def _write_atomic(path: Path, content: bytes):
+        """Write content to path via a temp file and rename, so readers never see a partial file."""
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(content)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
     def _get_cik_by_symbol(self, symbol: str) -> Optional[str]:
         """
         Get CIK (Central Index Key) for a stock symbol.
@@ -202,23 +455,16 @@ class SECAnalyzer:
         try:
             # SEC provides a company tickers JSON file
             url = f"{self.SEC_API_BASE}/files/company_tickers.json"
-            response = requests.get(url, headers=self.HEADERS, timeout=10)
+            tickers_data = self._get_json(url, self.TICKERS_MAX_AGE)
 
-            if response.status_code != 200:
-                logger.warning(f"SEC API returned status {response.status_code}")
+            if tickers_data is None:
                 return None
 
-            tickers_data = response.json()
-
-            # Search for the symbol
-            for entry in tickers_data.values():
-                if entry.get("ticker", "").upper() == symbol.upper():
-                    cik = str(entry.get("cik_str"))
-                    # Pad CIK to 10 digits
-                    cik_padded = cik.zfill(10)
-                    self.cik_cache[symbol] = cik_padded
-                    logger.info(f"Found CIK {cik_padded} for symbol {symbol}")
-                    return cik_padded
+            cik_padded = self._build_ticker_index(tickers_data).get(symbol.upper())
+            if cik_padded:
+                self.cik_cache[symbol] = cik_padded
+                logger.info(f"Found CIK {cik_padded} for symbol {symbol}")
+                return cik_padded
 
             logger.warning(f"Symbol {symbol} not found in SEC database")
             return None
@@ -227,12 +473,35 @@ class SECAnalyzer:
             logger.error(f"Error fetching CIK for {symbol}: {e}")
             return None
 
+    def _build_ticker_index(self, tickers_data: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Index company_tickers.json by ticker for O(1) CIK lookups.
+
+        The index is shared across instances and only rebuilt when a new copy
+        of the tickers file has been parsed.
+
+        Args:
+            tickers_data: Parsed company_tickers.json
+
+        Returns:
+            Dict mapping upper-case ticker to 10-digit padded CIK
+        """
+        if tickers_data is not SECAnalyzer._ticker_index_source:
+            index = {}
+            for entry in tickers_data.values():
+                # Keep the first entry for a ticker, as the linear scan did
+                index.setdefault(entry.get("ticker", "").upper(), str(entry.get("cik_str")).zfill(10))
+            SECAnalyzer._ticker_index = index
+            SECAnalyzer._ticker_index_source = tickers_data
+
+        return SECAnalyzer._ticker_index
+
     def _get_recent_filings(
         self,
         cik: str,
         lookback_days: int,
         max_filings: int
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Filing]:
         """
         Fetch recent filings for a CIK.
 
@@ -242,65 +511,61 @@ class SECAnalyzer:
             max_filings: Maximum filings to return
 
         Returns:
-            List of filing dictionaries
+            List of filings, most recent first
         """
         try:
             # SEC submissions endpoint
             url = f"{self.SEC_API_BASE}/submissions/CIK{cik}.json"
+            data = self._get_json(url, self.SUBMISSIONS_MAX_AGE, extract=self._trim_submissions)
 
-            # Rate limiting: SEC requests max 10 requests per second
-            time.sleep(0.1)
-
-            response = requests.get(url, headers=self.HEADERS, timeout=10)
-
-            if response.status_code != 200:
-                logger.warning(f"SEC API returned status {response.status_code} for CIK {cik}")
+            if data is None:
                 return []
 
-            data = response.json()
-
             # Extract recent filings
             recent = data.get("filings", {}).get("recent", {})
 
             if not recent:
                 return []
 
-            # Build list of filings
-            filings = []
-            cutoff_date = datetime.now() - timedelta(days=lookback_days)
-
-            forms = recent.get("form", [])
-            filing_dates = recent.get("filingDate", [])
-            accession_numbers = recent.get("accessionNumber", [])
-            primary_documents = recent.get("primaryDocument", [])
-
-            for i in range(len(forms)):
-                # Parse filing date
-                try:
-                    filing_date = datetime.strptime(filing_dates[i], "%Y-%m-%d")
-                except (ValueError, IndexError):
-                    continue
-
-                # Check if within lookback window
-                if filing_date < cutoff_date:
-                    continue
-
-                # Only include relevant filing types
-                form = forms[i]
-                if form not in self.FILING_TYPES and not form.startswith("8-K"):
-                    continue
-
-                filings.append({
-                    "form": form,
-                    "filingDate": filing_dates[i],
-                    "accessionNumber": accession_numbers[i] if i < len(accession_numbers) else "",
-                    "primaryDocument": primary_documents[i] if i < len(primary_documents) else "",
-                    "description": self.FILING_TYPES.get(form, form)
-                })
-
-                # Limit to max_filings
-                if len(filings) >= max_filings:
-                    break
+            # Filing dates are ISO "YYYY-MM-DD" strings, which order the same
+            # as the dates themselves, so they are compared without parsing.
+            # A filing dated on the cutoff day falls before the cutoff instant,
+            # hence the strict comparison.
+            cutoff_str = (datetime.now() - timedelta(days=lookback_days)).strftime("%Y-%m-%d")
+
+            # SEC lists filings newest first, so everything past the first
+            # filing at or before the cutoff can be skipped. Empty, malformed
+            # or missing dates count as in-window here: they must neither stop
+            # the scan early nor raise, and the mask below drops them.
+            raw_dates = recent.get("filingDate", [])
+            window = bisect_left(
+                range(len(raw_dates)), True,
+                key=lambda i: self._is_before_cutoff(raw_dates[i], cutoff_str)
+            )
+
+            # Build a frame over the in-window prefix of the parallel filing
+            # arrays. Columns are built as Series so shorter arrays are padded
+            # rather than rejected.
+            frame = pd.DataFrame({
+                column: pd.Series(recent.get(column, [])[:window], dtype=object)
+                for column in self.SUBMISSION_COLUMNS
+            })
+
+            filing_dates = frame["filingDate"]
+            forms = frame["form"]
+
+            # Well-formed date within lookback window and a relevant filing type
+            mask = (
+                filing_dates.str.fullmatch(self.FILING_DATE_PATTERN.pattern, na=False)
+                & (filing_dates > cutoff_str)
+                & (forms.isin(list(self.FILING_TYPES)) | forms.str.startswith("8-K", na=False))
+            )
+
+            recent_frame = frame.loc[mask].head(max_filings).fillna("")
+            recent_frame["description"] = [
+                self.FILING_TYPES.get(form, form) for form in recent_frame["form"]
+            ]
+            filings = list(map(Filing._make, recent_frame.itertuples(index=False, name=None)))
 
             return filings
 
@@ -308,47 +573,58 @@ class SECAnalyzer:
             logger.error(f"Error fetching filings for CIK {cik}: {e}")
             return []
 
-    def _analyze_filing_sentiment(self, filing: Dict[str, Any]) -> float:
+    @classmethod
+    def _is_before_cutoff(cls, filing_date: Any, cutoff_str: str) -> bool:
+        """Return True if filing_date is a well-formed ISO date on or before cutoff_str."""
+        return (
+            isinstance(filing_date, str)
+            and cls.FILING_DATE_PATTERN.fullmatch(filing_date) is not None
+            and filing_date <= cutoff_str
+        )
+
+    @classmethod
+    def _trim_submissions(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Keep only the recent-filing columns used by _get_recent_filings.
+
+        Submissions for large filers carry several MB of company metadata and
+        extra filing columns. Trimming them before caching keeps cache files
+        small and cache hits cheap to parse. The trimmed document keeps the
+        original filings.recent layout.
+        """
+        recent = data.get("filings", {}).get("recent", {})
+        return {
+            "filings": {
+                "recent": {column: recent.get(column, []) for column in cls.SUBMISSION_COLUMNS}
+            }
+        }
+
+    def _analyze_filing_sentiment(self, filing: Filing) -> float:
         """
         Analyze sentiment of a filing.
 
         Args:
-            filing: Filing dictionary
+            filing: Filing to score
 
         Returns:
             Sentiment score (-1 to 1)
         """
-        form = filing.get("form", "")
-        description = filing.get("description", "").lower()
+        form = filing.form
+        description = filing.description
 
         # Base sentiment by filing type
-        if form == "8-K":
-            # Material events - need content analysis
-            # For now, neutral unless we detect keywords
-            sentiment = 0.0
-        elif form in ["10-Q", "10-K"]:
-            # Earnings reports - slightly positive (company is operational)
-            sentiment = 0.1
-        elif form == "4":
-            # Insider trading - context-dependent, default neutral
-            sentiment = 0.0
-        elif form in ["SC 13G", "SC 13D"]:
-            # Large ownership changes - slightly positive (institutional interest)
-            sentiment = 0.2
-        elif form == "S-1":
-            # IPO registration - positive
-            sentiment = 0.3
-        else:
-            sentiment = 0.0
-
-        # Adjust based on description keywords
-        description_text = description.lower()
-
-        positive_matches = sum(1 for kw in self.POSITIVE_KEYWORDS if kw in description_text)
-        negative_matches = sum(1 for kw in self.NEGATIVE_KEYWORDS if kw in description_text)
+        sentiment = self.BASE_SENTIMENT.get(form, 0.0)
+
+        # Adjust based on description keywords. Each distinct keyword counts
+        # once, regardless of how often it occurs.
+        matched = {
+            self.KEYWORD_GROUPS[match.lastindex - 1]
+            for match in self.KEYWORD_PATTERN.finditer(description)
+        }
+        net_matches = sum(self.KEYWORD_WEIGHTS[kw] for kw in matched)
 
         # Adjust sentiment based on keyword matches
-        sentiment += (positive_matches * 0.2) - (negative_matches * 0.2)
+        sentiment += net_matches * 0.2
 
         # Clamp to [-1, 1]
         sentiment = max(-1.0, min(1.0, sentiment))
@@ -356,6 +632,23 @@ class SECAnalyzer:
         return sentiment
 
 
+# Global singleton instance
+_sec_analyzer = None
+
+
 def get_sec_analyzer() -> SECAnalyzer:
-    """Factory function to get SEC analyzer instance."""
-    return SECAnalyzer()
+    """
+    Get or create global SEC analyzer instance.
+
+    Using a singleton so the CIK cache and pooled HTTP session persist
+    across callers.
+
+    Returns:
+        SECAnalyzer instance
+    """
+    global _sec_analyzer
+
+    if _sec_analyzer is None:
+        _sec_analyzer = SECAnalyzer()
+
+    return _sec_analyzer